@@ -12,89 +12,51 @@ Structure:
     └── app.py          # Application entry point
 """
 
-from .app import main
-from .core import (
-    TN3270_CONTROL_CHANNEL,
-    Config,
-    ErrorCodes,
-    TN3270Config,
-    TerminalError,
-    ValkeyConfig,
-    get_config,
-    get_tn3270_input_channel,
-    get_tn3270_output_channel,
-)
-from .models import (
-    DataMessage,
-    ErrorMessage,
-    MessageEnvelope,
-    MessageType,
-    PingMessage,
-    PongMessage,
-    SessionCreatedMessage,
-    SessionCreateMessage,
-    SessionDestroyedMessage,
-    SessionDestroyMessage,
-    create_data_message,
-    create_error_message,
-    create_session_created_message,
-    create_session_destroyed_message,
-    parse_message,
-    serialize_message,
-)
-from .services import (
-    TN3270Manager,
-    TN3270Session,
-    TN3270Renderer,
-    ValkeyClient,
-    close_valkey_client,
-    get_tn3270_manager,
-    get_valkey_client,
-    init_tn3270_manager,
-    init_valkey_client,
-)
+from ._lazy import lazy_exports
 
-__all__ = [
-    # App
-    "main",
-    # Channels
-    "get_tn3270_input_channel",
-    "get_tn3270_output_channel",
-    "TN3270_CONTROL_CHANNEL",
-    # Config
-    "Config",
-    "ValkeyConfig",
-    "TN3270Config",
-    "get_config",
-    # Errors
-    "ErrorCodes",
-    "TerminalError",
+# Public names mapped to the submodule that defines them. Submodules are
+# imported on first attribute access (PEP 562) so that importing the package
+# does not pull in structlog, pydantic, redis and tnz up front.
+_LAZY_EXPORTS: dict[str, str] = {
+    # Core
+    "TN3270_CONTROL_CHANNEL": ".core",
+    "Config": ".core",
+    "ErrorCodes": ".core",
+    "TN3270Config": ".core",
+    "TerminalError": ".core",
+    "ValkeyConfig": ".core",
+    "get_config": ".core",
+    "get_tn3270_input_channel": ".core",
+    "get_tn3270_output_channel": ".core",
     # Models
-    "MessageType",
-    "DataMessage",
-    "PingMessage",
-    "PongMessage",
-    "ErrorMessage",
-    "SessionCreateMessage",
-    "SessionDestroyMessage",
-    "SessionCreatedMessage",
-    "SessionDestroyedMessage",
-    "MessageEnvelope",
-    "parse_message",
-    "serialize_message",
-    "create_data_message",
-    "create_error_message",
-    "create_session_created_message",
-    "create_session_destroyed_message",
-    # TN3270 Manager
-    "TN3270Manager",
-    "TN3270Session",
-    "TN3270Renderer",
-    "get_tn3270_manager",
-    "init_tn3270_manager",
-    # Valkey Client
-    "ValkeyClient",
-    "get_valkey_client",
-    "init_valkey_client",
-    "close_valkey_client",
-]
+    "DataMessage": ".models",
+    "ErrorMessage": ".models",
+    "MessageEnvelope": ".models",
+    "MessageType": ".models",
+    "PingMessage": ".models",
+    "PongMessage": ".models",
+    "SessionCreatedMessage": ".models",
+    "SessionCreateMessage": ".models",
+    "SessionDestroyedMessage": ".models",
+    "SessionDestroyMessage": ".models",
+    "create_data_message": ".models",
+    "create_error_message": ".models",
+    "create_session_created_message": ".models",
+    "create_session_destroyed_message": ".models",
+    "parse_message": ".models",
+    "serialize_message": ".models",
+    # Services
+    "TN3270Manager": ".services",
+    "TN3270Session": ".services",
+    "TN3270Renderer": ".services",
+    "ValkeyClient": ".services",
+    "close_valkey_client": ".services",
+    "get_tn3270_manager": ".services",
+    "get_valkey_client": ".services",
+    "init_tn3270_manager": ".services",
+    "init_valkey_client": ".services",
+}
+
+__all__ = tuple(_LAZY_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(globals(), _LAZY_EXPORTS)
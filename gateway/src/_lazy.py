@@ -0,0 +1,42 @@
+# ============================================================================
+# Lazy Package Exports
+# ============================================================================
+"""
+PEP 562 helpers for packages that re-export names from their submodules.
+
+Kept at the top of the package (not under core/) so using it does not import
+core's configuration as a side effect.
+"""
+
+from collections.abc import Callable
+from importlib import import_module
+from typing import Any
+
+
+def lazy_exports(
+    namespace: dict[str, Any], exports: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build a package's module ``__getattr__`` and ``__dir__``.
+
+    Args:
+        namespace: The package's ``globals()``; loaded values are cached here
+        exports: Public names mapped to the (relative) submodule defining them
+
+    Returns:
+        Tuple of (__getattr__, __dir__) to bind at package level
+    """
+    package = namespace["__name__"]
+
+    def module_getattr(name: str) -> Any:
+        """Import public names lazily on first access."""
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(module_name, package), name)
+        namespace[name] = value
+        return value
+
+    def module_dir() -> list[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return module_getattr, module_dir
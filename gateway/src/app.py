@@ -3,39 +3,183 @@
 # ============================================================================
 
 import asyncio
+import contextlib
+import logging
+import os
+import selectors
 import signal
+import socket
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from types import FrameType
+from typing import Any
 
 import structlog
 
-from .core import get_config
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is optional (not available on Windows)
+    uvloop = None
+
+from .core import TN3270Config, ValkeyConfig, get_config
+from .core.config import DynamoDBConfig
 from .services import (
+    TN3270Manager,
+    ValkeyClient,
     close_valkey_client,
-    get_tn3270_manager,
     init_tn3270_manager,
     init_valkey_client,
 )
 
-# Configure structlog
-structlog.configure(
-    processors=[
-        structlog.stdlib.add_log_level,
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
-        structlog.dev.ConsoleRenderer(),
-    ],
-    wrapper_class=structlog.BoundLogger,
-    context_class=dict,
-    logger_factory=structlog.PrintLoggerFactory(),
-    cache_logger_on_first_use=True,
+# Logging: JSON lines, written as pre-encoded bytes when orjson is available;
+# calls below LOG_LEVEL are dropped before any processor runs
+if orjson is not None:
+    _renderer = structlog.processors.JSONRenderer(serializer=orjson.dumps)
+    _logger_factory: Any = structlog.BytesLoggerFactory()
+else:  # pragma: no cover - depends on optional orjson
+    _renderer = structlog.processors.JSONRenderer()
+    _logger_factory = structlog.PrintLoggerFactory()
+
+
+def _add_timestamp(
+    logger: Any, method_name: str, event_dict: structlog.typing.EventDict
+) -> structlog.typing.EventDict:
+    """Stamp events with epoch nanoseconds (ISO formatting is left to the log shipper)."""
+    event_dict["ts"] = time.time_ns()
+    return event_dict
+
+
+# Built once at import; structlog walks this chain for every emitted event
+_PROCESSORS: tuple[structlog.typing.Processor, ...] = (
+    structlog.stdlib.add_log_level,
+    _add_timestamp,
+    structlog.processors.format_exc_info,
+    _renderer,
 )
 
+
+def _configure_logging() -> None:
+    """Install the gateway's structlog configuration (called from main only)."""
+    level = os.getenv("LOG_LEVEL", "INFO").upper()
+    structlog.configure(
+        processors=_PROCESSORS,
+        wrapper_class=structlog.make_filtering_bound_logger(
+            logging.getLevelNamesMapping().get(level, logging.INFO)
+        ),
+        context_class=dict,
+        logger_factory=_logger_factory,
+        cache_logger_on_first_use=True,
+    )
+
+
 log = structlog.get_logger()
 
-_shutdown_event: asyncio.Event | None = None
+# Resolved exactly once to release async_main; a Future is enough for the
+# single waiter
+_shutdown_future: asyncio.Future[None] | None = None
+
+
+@dataclass
+class GatewayState:
+    """Components brought up by async_main; shutdown tears down only these."""
+
+    tn3270_manager: TN3270Manager | None = None
+    valkey_started: bool = False
+
+
+# Signals that trigger a graceful shutdown, keyed by the signal number byte
+# written to the wakeup fd
+_SHUTDOWN_SIGNALS: dict[int, signal.Signals] = {
+    sig.value: sig for sig in (signal.SIGTERM, signal.SIGINT)
+}
+
+
+# Noise signals the gateway never acts on; ignored at the OS level so their
+# delivery never reaches Python (getattr: not all exist on every platform)
+_IGNORED_SIGNALS: tuple[signal.Signals, ...] = tuple(
+    sig
+    for sig in (getattr(signal, name, None) for name in ("SIGPIPE", "SIGHUP", "SIGQUIT"))
+    if sig is not None
+)
+
+
+def _ignore_signal(signum: int, frame: FrameType | None) -> None:
+    """No-op Python handler; the C-level handler already wrote to the wakeup fd."""
+
+
+def _install_signal_wakeup(
+    loop: asyncio.AbstractEventLoop,
+    handle_signal: Callable[[signal.Signals], None],
+) -> Callable[[], None]:
+    """Deliver SIGTERM/SIGINT through a wakeup socket drained by the event loop.
+
+    Every pending signal number is collected with a single recv() per loop
+    wake-up instead of one scheduled callback per signal. SIGPIPE, SIGHUP and
+    SIGQUIT are ignored. Returns a callable that restores the previous
+    handlers and wakeup fd.
+    """
+    rsock, wsock = socket.socketpair()
+    rsock.setblocking(False)
+    wsock.setblocking(False)
 
+    previous_handlers = {
+        sig: signal.signal(sig, _ignore_signal) for sig in _SHUTDOWN_SIGNALS.values()
+    }
+    for sig in _IGNORED_SIGNALS:
+        previous_handlers[sig] = signal.signal(sig, signal.SIG_IGN)
+    previous_wakeup_fd = signal.set_wakeup_fd(wsock.fileno(), warn_on_full_buffer=False)
 
-async def shutdown(sig: signal.Signals | None = None) -> None:
+    def drain() -> None:
+        try:
+            data = rsock.recv(64)
+        except (BlockingIOError, InterruptedError):
+            return
+        for signum in data:
+            sig = _SHUTDOWN_SIGNALS.get(signum)
+            if sig is not None:
+                handle_signal(sig)
+
+    loop.add_reader(rsock.fileno(), drain)
+
+    def restore() -> None:
+        loop.remove_reader(rsock.fileno())
+        signal.set_wakeup_fd(previous_wakeup_fd)
+        for sig, handler in previous_handlers.items():
+            signal.signal(sig, handler)
+        rsock.close()
+        wsock.close()
+
+    return restore
+
+
+def _init_dynamodb(config: DynamoDBConfig) -> None:
+    """Create the DynamoDB client, validating the connection (blocking)."""
+    from .db import get_dynamodb_client
+
+    get_dynamodb_client(config)
+
+
+async def _start_tn3270(
+    state: GatewayState, valkey_config: ValkeyConfig, tn3270_config: TN3270Config
+) -> ValkeyClient:
+    """Connect to Valkey and start the TN3270 manager on top of it."""
+    valkey = await init_valkey_client(valkey_config)
+    state.valkey_started = True
+
+    tn3270_manager = init_tn3270_manager(tn3270_config, valkey)
+    await tn3270_manager.start()
+    state.tn3270_manager = tn3270_manager
+    return valkey
+
+
+async def shutdown(state: GatewayState, sig: signal.Signals | None = None) -> None:
     """Graceful shutdown handler."""
     if sig:
         log.info("Received shutdown signal", signal=sig.name)
@@ -43,75 +187,118 @@ async def shutdown(sig: signal.Signals | None = None) -> None:
         log.info("Shutting down")
 
     # Destroy all TN3270 sessions
-    try:
-        tn3270_manager = get_tn3270_manager()
+    tn3270_manager, state.tn3270_manager = state.tn3270_manager, None
+    if tn3270_manager is not None:
         await tn3270_manager.destroy_all_sessions()
-    except RuntimeError:
-        pass
 
     # Close Valkey connection
-    await close_valkey_client()
+    if state.valkey_started:
+        state.valkey_started = False
+        await close_valkey_client()
 
     log.info("Shutdown complete")
 
     # Signal main loop to exit
-    if _shutdown_event:
-        _shutdown_event.set()
+    if _shutdown_future is not None and not _shutdown_future.done():
+        _shutdown_future.set_result(None)
 
 
 async def async_main() -> None:
     """Async main entry point."""
-    global _shutdown_event
-    _shutdown_event = asyncio.Event()
+    global _shutdown_future
+    loop = asyncio.get_running_loop()
+    shutdown_future: asyncio.Future[None] = loop.create_future()
+    _shutdown_future = shutdown_future
+    shutdown_signal: signal.Signals | None = None
+    state = GatewayState()
 
     config = get_config()
+    valkey_config = config.valkey
+    tn3270_config = config.tn3270
 
-    log.info(
-        "Starting TN3270 Gateway",
-        valkey_host=config.valkey.host,
-        valkey_port=config.valkey.port,
-        tn3270_host=config.tn3270.host,
-        tn3270_port=config.tn3270.port,
-        tn3270_max_sessions=config.tn3270.max_sessions,
+    startup_log = log.bind(
+        valkey_host=valkey_config.host,
+        valkey_port=valkey_config.port,
+        tn3270_host=tn3270_config.host,
+        tn3270_port=tn3270_config.port,
+        tn3270_max_sessions=tn3270_config.max_sessions,
     )
+    startup_log.info("Starting TN3270 Gateway")
 
-    # Initialize DynamoDB client (validates connection)
-    from .db import get_dynamodb_client
-
-    get_dynamodb_client(config.dynamodb)
-
-    # Initialize Valkey client
-    valkey = await init_valkey_client(config.valkey)
+    try:
+        # Initialize the DynamoDB client (botocore model loading + describe_table)
+        # in a worker thread while Valkey connects and the TN3270 manager
+        # subscribes to its control channel. A TaskGroup cancels and awaits
+        # the sibling if either fails, so shutdown never races a half-finished
+        # startup that is still setting state
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(asyncio.to_thread(_init_dynamodb, config.dynamodb))
+                tn3270_task = tg.create_task(
+                    _start_tn3270(state, valkey_config, tn3270_config)
+                )
+        except BaseExceptionGroup as group:
+            # Surface the startup failure itself rather than the group
+            raise group.exceptions[0] from None
+        valkey = tn3270_task.result()
 
-    # Initialize TN3270 manager and start listening
-    tn3270_manager = init_tn3270_manager(config.tn3270, valkey)
-    await tn3270_manager.start()
+        # Start the Valkey message listener
+        await valkey.start_listening()
 
-    # Start the Valkey message listener
-    await valkey.start_listening()
+        # Setup signal handlers
+        def handle_signal(sig: signal.Signals) -> None:
+            # Repeated signals (e.g. a supervisor retrying SIGTERM) only
+            # record the first one; teardown runs once, below
+            nonlocal shutdown_signal
+            if shutdown_signal is not None:
+                return
+            shutdown_signal = sig
+            if not shutdown_future.done():
+                shutdown_future.set_result(None)
 
-    # Setup signal handlers
-    loop = asyncio.get_running_loop()
+        restore_signals = _install_signal_wakeup(loop, handle_signal)
 
-    def handle_signal(sig: signal.Signals) -> None:
-        asyncio.create_task(shutdown(sig))
+        startup_log.info("TN3270 Gateway ready, waiting for connections...")
 
-    for sig in (signal.SIGTERM, signal.SIGINT):
-        loop.add_signal_handler(sig, handle_signal, sig)
+        # Keep running until shutdown
+        try:
+            await shutdown_future
+        finally:
+            restore_signals()
+    finally:
+        # Tear down on this loop, which owns the sessions and connections,
+        # whatever the exit reason (signal, startup failure, cancellation)
+        await shutdown(state, shutdown_signal)
 
-    log.info("TN3270 Gateway ready, waiting for connections...")
 
-    # Keep running until shutdown
-    await _shutdown_event.wait()
+def _loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Pick the event loop implementation for the gateway."""
+    # Prefer uvloop's libuv-backed event loop when installed
+    if uvloop is not None:
+        return uvloop.new_event_loop
+    # Otherwise hand the selector loop epoll directly instead of letting
+    # DefaultSelector probe for it
+    if sys.platform == "linux":
+        return lambda: asyncio.SelectorEventLoop(selectors.EpollSelector())
+    return None
 
 
 def main() -> None:
     """Main entry point."""
-    try:
-        asyncio.run(async_main())
-    except KeyboardInterrupt:
-        # Run cleanup synchronously
-        asyncio.run(shutdown())
+    _configure_logging()
+
+    loop_factory = _loop_factory()
+    # Debug mode (and its slow-callback instrumentation) is opt-in only, so
+    # PYTHONASYNCIODEBUG in the environment cannot slow down production
+    debug = os.getenv("GATEWAY_ASYNCIO_DEBUG") == "1"
+    with asyncio.Runner(debug=debug, loop_factory=loop_factory) as runner:
+        if debug:
+            runner.get_loop().slow_callback_duration = 0.05
+        # Ctrl-C before the signal wakeup is installed (during startup): the
+        # runner cancels async_main, whose finally already ran shutdown, then
+        # re-raises; exit quietly instead of a traceback
+        with contextlib.suppress(KeyboardInterrupt):
+            runner.run(async_main())
 
 
 if __name__ == "__main__":
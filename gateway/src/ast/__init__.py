@@ -8,22 +8,20 @@ Each AST is a self-contained automation script that performs a specific
 transaction or workflow on the mainframe.
 """
 
-from .base import (
-    AST,
-    ASTResult,
-    ASTStatus,
-    ItemResult,
-    ProgressCallback,
-    ItemResultCallback,
-)
-from .login import LoginAST
+from .._lazy import lazy_exports
 
-__all__ = [
-    "AST",
-    "ASTResult",
-    "ASTStatus",
-    "ItemResult",
-    "ProgressCallback",
-    "ItemResultCallback",
-    "LoginAST",
-]
+# Public names mapped to the submodule that defines them (loaded on first use)
+_LAZY_EXPORTS: dict[str, str] = {
+    "AST": ".base",
+    "ASTResult": ".base",
+    "ASTStatus": ".base",
+    "ItemResult": ".base",
+    "ItemResultAccumulator": ".base",
+    "ProgressCallback": ".base",
+    "ItemResultCallback": ".base",
+    "LoginAST": ".login",
+}
+
+__all__ = tuple(_LAZY_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(globals(), _LAZY_EXPORTS)
@@ -5,12 +5,21 @@
 Base class for all AST (Automated Streamlined Transaction) scripts.
 """
 
+import asyncio
+import logging
+import os
+import queue
 import threading
+import time
 from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Callable, MutableSequence
+from concurrent.futures import Executor, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime
-from enum import Enum
-from typing import TYPE_CHECKING, Any, Callable, Literal, Optional
+from datetime import datetime, timedelta
+from enum import StrEnum
+from functools import partial
+from typing import TYPE_CHECKING, Any, Literal, Optional
 from uuid import uuid4
 
 import structlog
@@ -21,10 +30,65 @@ if TYPE_CHECKING:
     from ..db import DynamoDBClient
     from ..services.tn3270.host import Host
 
-log = structlog.get_logger()
+__all__ = (
+    "AST",
+    "ASTResult",
+    "ASTStatus",
+    "ItemResult",
+    "ItemResultAccumulator",
+    "ItemResultCallback",
+    "PauseStateCallback",
+    "ProgressCallback",
+)
 
+log = structlog.get_logger()
 
-class ASTStatus(Enum):
+# DynamoDB's BatchWriteItem limit
+_WRITE_BATCH_SIZE = 25
+# Longest a buffered item result waits for more results before it is written
+_WRITE_FLUSH_INTERVAL = 1.0
+# Most parallel outcomes recorded per wake-up of the recording thread
+_RESULT_DRAIN_BATCH = 32
+# Least time between forwarded "running" progress updates (10 Hz)
+_PROGRESS_MIN_INTERVAL = 0.1
+# Progress message per item outcome, filled with a single % substitution
+_ITEM_COUNTS = " (%d success, %d failed, %d skipped)"
+_ITEM_MESSAGES = {
+    "success": "Item %d/%d: Completed" + _ITEM_COUNTS,
+    "failed": "Item %d/%d: Failed - %s" + _ITEM_COUNTS,
+    "skipped": "Item %d/%d: Skipped" + _ITEM_COUNTS,
+}
+# Item outcomes, each with a ``<status>_count`` on the execution record
+_ITEM_STATUSES = ("success", "failed", "skipped")
+# Least time between running-count updates for partial batches; a full
+# batch always updates them
+_COUNT_UPDATE_INTERVAL = 5.0
+
+# What the sink thread is fed: an item result to batch, a write to run, or
+# None to write what is left and stop
+_SinkEntry = tuple[str, dict[str, Any]] | Callable[[], None] | None
+
+
+def _max_parallel_workers() -> int:
+    """Cap on parallel AST workers, overridable with ``AST_MAX_WORKERS``.
+
+    Workers spend their time waiting on TN3270 round trips, so this is an
+    I/O-sized pool; the default mirrors ThreadPoolExecutor's own. A value
+    that is not an integer is ignored (with a warning) rather than failing
+    a run that already has its execution record.
+    """
+    default = min(32, (os.cpu_count() or 1) * 5)
+    raw = os.getenv("AST_MAX_WORKERS")
+    if raw is None:
+        return default
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        log.warning("Ignoring non-integer AST_MAX_WORKERS", value=raw, default=default)
+        return default
+
+
+class ASTStatus(StrEnum):
     """Status of an AST execution."""
 
     PENDING = "pending"
@@ -35,7 +99,7 @@ class ASTStatus(Enum):
     TIMEOUT = "timeout"
 
 
-@dataclass
+@dataclass(slots=True)
 class ItemResult:
     """Result of processing a single item (e.g., policy)."""
 
@@ -48,19 +112,19 @@ class ItemResult:
     data: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ASTResult:
     """Result of an AST execution."""
 
     status: ASTStatus
     message: str = ""
     current_screen: str = ""
-    data: dict[str, Any] = field(default_factory=lambda: {})
+    data: dict[str, Any] = field(default_factory=dict)
     started_at: datetime | None = None
     completed_at: datetime | None = None
     error: str | None = None
-    screenshots: list[str] = field(default_factory=lambda: [])
-    item_results: list[ItemResult] = field(default_factory=lambda: [])
+    screenshots: list[str] = field(default_factory=list)
+    item_results: list[ItemResult] = field(default_factory=list)
 
     @property
     def duration(self) -> float | None:
@@ -75,6 +139,32 @@ class ASTResult:
         return self.status == ASTStatus.SUCCESS
 
 
+@dataclass(slots=True)
+class ItemResultAccumulator:
+    """Item results of one execution plus running per-status counts.
+
+    ``results`` may be pre-sized with ``None`` slots so results recorded out
+    of order (parallel runs) land at their item's index.
+    """
+
+    results: list[ItemResult | None] = field(default_factory=list)
+    success: int = 0
+    failed: int = 0
+    skipped: int = 0
+
+    def add(self, result: ItemResult, index: int | None = None) -> None:
+        """Store a result and bump the counter for its status."""
+        if index is None:
+            self.results.append(result)
+        else:
+            self.results[index] = result
+        setattr(self, result.status, getattr(self, result.status) + 1)
+
+    def recorded(self) -> list[ItemResult]:
+        """Results in item order, leaving out items that never ran."""
+        return [r for r in self.results if r is not None]
+
+
 # Type for progress callback
 ProgressCallback = Callable[
     [
@@ -128,20 +218,45 @@ class AST(ABC):
     auth_application: str = ""  # Application name for login
     auth_group: str = ""  # Group name for login
 
+    # Keep screenshots of successful logins made by parallel workers
+    capture_screenshots_parallel: bool = False
+    # Most screenshots kept per execution (the latest ones)
+    max_screenshots: int = 200
+
     def __init__(self) -> None:
         self._result: ASTResult | None = None
         self._execution_id: str = ""
         self._on_progress: ProgressCallback | None = None
         self._on_item_result: ItemResultCallback | None = None
         self._on_pause_state: PauseStateCallback | None = None
-
-        # Pause/resume synchronization
-        self._pause_event = threading.Event()
-        self._pause_event.set()  # Not paused by default
+        # Resolved once so per-item reports skip building discarded debug events
+        self._debug_enabled = log.is_enabled_for(logging.DEBUG)
+        # Throttles "running" updates, which parallel workers send directly
+        self._last_progress_ts = 0.0
+        self._progress_lock = threading.Lock()
+        # Logger for per-item events, bound to the execution in run()
+        self._item_log: Any = log
+
+        # Pause/resume synchronization; the event is only created on first pause
+        self._pause_event: threading.Event | None = None
         self._is_paused = False
         self._cancelled = False
-        self._db: Optional["DynamoDBClient"] = None
+        self._db: DynamoDBClient | None = None
         self._session_id: str = ""
+        # Host sessions currently signed in; items reuse them until a failure
+        self._authenticated_hosts: set[Host] = set()
+        # Log off after every item instead of reusing the session
+        self._full_cycle_per_item = False
+        # Per-status counts of item results persisted so far; only touched
+        # by the sink thread while it writes batches
+        self._row_counts = dict.fromkeys(_ITEM_STATUSES, 0)
+        self._counts_written_at = 0.0
+        # Single "sink" thread that owns DynamoDB writes and batches item
+        # results, created on first use so session I/O threads never block
+        # on persistence
+        self._sink_queue: queue.Queue[_SinkEntry] | None = None
+        self._sink_thread: threading.Thread | None = None
+        self._sink_lock = threading.Lock()
 
     def set_callbacks(
         self,
@@ -158,6 +273,8 @@ class AST(ABC):
         """Pause the AST execution. Will pause before the next policy."""
         if not self._is_paused:
             self._is_paused = True
+            if self._pause_event is None:
+                self._pause_event = threading.Event()
             self._pause_event.clear()
             log.info("AST paused", ast=self.name, execution_id=self._execution_id)
             if self._on_pause_state:
@@ -169,7 +286,8 @@ class AST(ABC):
         """Resume the AST execution."""
         if self._is_paused:
             self._is_paused = False
-            self._pause_event.set()
+            if self._pause_event is not None:
+                self._pause_event.set()
             log.info("AST resumed", ast=self.name, execution_id=self._execution_id)
             if self._on_pause_state:
                 self._on_pause_state(False, "AST resumed")
@@ -177,7 +295,8 @@ class AST(ABC):
     def cancel(self) -> None:
         """Cancel the AST execution."""
         self._cancelled = True
-        self._pause_event.set()  # Unblock if paused
+        if self._pause_event is not None:
+            self._pause_event.set()  # Unblock if paused
         log.info("AST cancelled", ast=self.name, execution_id=self._execution_id)
 
     def wait_if_paused(self, timeout: float | None = None) -> bool:
@@ -194,7 +313,10 @@ class AST(ABC):
             return False
 
         # Wait for the pause event to be set (i.e., not paused)
-        self._pause_event.wait(timeout=timeout)
+        event = self._pause_event
+        if event is None or event.is_set():
+            return True
+        event.wait(timeout=timeout)
 
         return not self._cancelled
 
@@ -221,6 +343,8 @@ class AST(ABC):
         """Report progress to the callback."""
         if self._on_progress:
             self._on_progress(current, total, current_item, item_status, message)
+        if not self._debug_enabled:
+            return
         log.debug(
             "AST progress",
             ast=self.name,
@@ -230,6 +354,30 @@ class AST(ABC):
             item_status=item_status,
         )
 
+    def _maybe_report_progress(
+        self,
+        current: int,
+        total: int,
+        current_item: str | None = None,
+        item_status: (
+            Literal["pending", "running", "success", "failed", "skipped"] | None
+        ) = None,
+        message: str | None = None,
+    ) -> None:
+        """Report progress, dropping "running" updates that come too fast.
+
+        In-flight updates are capped at 10 Hz across all workers so large
+        runs do not flood the client; any other status always goes through.
+        Workers call this concurrently, so the check-then-set is locked.
+        """
+        if item_status == "running":
+            with self._progress_lock:
+                now = time.monotonic()
+                if now - self._last_progress_ts < _PROGRESS_MIN_INTERVAL:
+                    return
+                self._last_progress_ts = now
+        self.report_progress(current, total, current_item, item_status, message)
+
     def report_item_result(
         self,
         item_id: str,
@@ -241,6 +389,8 @@ class AST(ABC):
         """Report an item result to the callback."""
         if self._on_item_result:
             self._on_item_result(item_id, status, duration_ms, error, data)
+        if not self._debug_enabled:
+            return
         log.debug(
             "AST item result",
             ast=self.name,
@@ -267,6 +417,7 @@ class AST(ABC):
             ASTResult with execution status and data
         """
         self._execution_id = execution_id or str(uuid4())
+        self._item_log = log.bind(ast=self.name, execution_id=self._execution_id)
         log.info(
             f"Starting AST: {self.name}",
             ast=self.name,
@@ -290,7 +441,7 @@ class AST(ABC):
                 f"AST completed: {self.name}",
                 ast=self.name,
                 execution_id=self._execution_id,
-                status=result.status.value,
+                status=result.status,
                 duration=result.duration,
             )
 
@@ -316,11 +467,38 @@ class AST(ABC):
             )
 
         finally:
-            result.completed_at = datetime.now()
+            result.completed_at = result.completed_at or datetime.now()
 
         self._result = result
         return result
 
+    async def run_async(
+        self,
+        host: "Host",
+        execution_id: str | None = None,
+        executor: Executor | None = None,
+        **kwargs: Any,
+    ) -> ASTResult:
+        """
+        Await the AST from a coroutine without blocking the event loop.
+
+        The TN3270 and DynamoDB calls underneath are blocking, so the item
+        cycle itself runs on ``executor`` (the loop default if omitted).
+
+        Args:
+            host: The Host automation interface
+            execution_id: Optional execution ID (generated if not provided)
+            executor: Executor to run the blocking cycle on
+            **kwargs: Additional parameters for the AST
+
+        Returns:
+            ASTResult with execution status and data
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor, partial(self.run, host, execution_id, **kwargs)
+        )
+
     @property
     def execution_id(self) -> str:
         """Get the current execution ID."""
@@ -343,15 +521,19 @@ class AST(ABC):
         error: Optional[str] = None,
         item_data: Optional[dict] = None,
     ) -> None:
-        """Save an item result to DynamoDB."""
+        """Queue an item result on the sink for a batched write.
+
+        See :meth:`_run_sink` for when batches are written. Timestamps are
+        queued as datetimes and formatted by the writer.
+        """
         if not self._db:
             return
 
         data: dict[str, Any] = {
             "status": status,
             "duration_ms": duration_ms,
-            "started_at": started_at.isoformat(),
-            "completed_at": completed_at.isoformat(),
+            "started_at": started_at,
+            "completed_at": completed_at,
             "entity_type": "POLICY_RESULT",
         }
         if error:
@@ -359,14 +541,111 @@ class AST(ABC):
         if item_data:
             data["policy_data"] = item_data
 
+        self._sink().put((item_id, data))
+
+    def _sink(self) -> queue.Queue[_SinkEntry]:
+        """Return the sink thread's inbox, starting the thread on first use."""
+        with self._sink_lock:
+            if self._sink_queue is None:
+                inbox: queue.Queue[_SinkEntry] = queue.Queue()
+                thread = threading.Thread(
+                    target=self._run_sink, args=(inbox,), name="ast_sink", daemon=True
+                )
+                thread.start()
+                self._sink_queue, self._sink_thread = inbox, thread
+            return self._sink_queue
+
+    def _run_sink(self, inbox: queue.Queue[_SinkEntry]) -> None:
+        """Sink thread: run queued writes in order and batch item results.
+
+        Buffered results are written once they fill a batch, or once the
+        oldest has waited ``_WRITE_FLUSH_INTERVAL`` seconds: the inbox is
+        only waited on until then, so a slow item does not hold earlier
+        results back.
+        """
+        pending: list[tuple[str, dict[str, Any]]] = []
+        flush_at = 0.0
+        while True:
+            timeout = max(0.0, flush_at - time.monotonic()) if pending else None
+            try:
+                entry = inbox.get(timeout=timeout)
+            except queue.Empty:
+                self._write_item_results(pending)
+                pending = []
+                continue
+            if entry is None:
+                break
+            if callable(entry):
+                entry()
+                continue
+            if not pending:
+                flush_at = time.monotonic() + _WRITE_FLUSH_INTERVAL
+            pending.append(entry)
+            # Also checked here: a steady stream of results never lets the
+            # wait above time out
+            if len(pending) >= _WRITE_BATCH_SIZE or time.monotonic() >= flush_at:
+                self._write_item_results(pending)
+                pending = []
+        self._write_item_results(pending)
+
+    def _drain_io(self) -> None:
+        """Have the sink write what it still holds, and wait for it to stop."""
+        with self._sink_lock:
+            inbox, self._sink_queue = self._sink_queue, None
+            thread, self._sink_thread = self._sink_thread, None
+        if inbox is not None:
+            inbox.put(None)
+            thread.join()
+
+    def _write_item_results(self, pending: list[tuple[str, dict[str, Any]]]) -> None:
+        """Send one batch of buffered item results to DynamoDB."""
+        if not pending or not self._db:
+            return
+
+        for _, data in pending:
+            data["started_at"] = data["started_at"].isoformat()
+            data["completed_at"] = data["completed_at"].isoformat()
+
         try:
-            self._db.put_policy_result(
+            self._db.batch_put_policy_results(
                 execution_id=self._execution_id,
-                policy_number=item_id,
-                data=data,
+                results=pending,
             )
         except Exception as e:  # pragma: no cover - defensive logging
-            log.warning("Failed to save item result", item=item_id, error=str(e))
+            log.warning(
+                "Failed to save item results",
+                items=[item_id for item_id, _ in pending],
+                error=str(e),
+            )
+            return
+        self._append_execution_rows(pending)
+
+    def _append_execution_rows(self, rows: list[tuple[str, dict[str, Any]]]) -> None:
+        """Fold a written batch into the execution record's running counts.
+
+        The record is updated for a full batch, otherwise at most once per
+        ``_COUNT_UPDATE_INTERVAL``, so slow runs flushing one or two results
+        at a time do not add an UpdateItem per batch.
+        """
+        counts = self._row_counts
+        for _, data in rows:
+            counts[data["status"]] += 1
+
+        now = time.monotonic()
+        if (
+            len(rows) < _WRITE_BATCH_SIZE
+            and now - self._counts_written_at < _COUNT_UPDATE_INTERVAL
+        ):
+            return
+        self._counts_written_at = now
+        try:
+            self._db.update_execution(
+                session_id=self._session_id,
+                execution_id=self._execution_id,
+                updates={f"{status}_count": n for status, n in counts.items()},
+            )
+        except Exception as e:  # pragma: no cover - defensive logging
+            log.warning("Failed to update execution counts", error=str(e))
 
     def _create_execution_record(
         self,
@@ -375,62 +654,73 @@ class AST(ABC):
         item_count: int,
         started_at: datetime,
     ) -> None:
-        """Create an execution record in DynamoDB."""
+        """Create an execution record in DynamoDB.
+
+        The write is queued on the sink ahead of any item results, so the
+        first login does not wait on it.
+        """
+        self._row_counts = dict.fromkeys(_ITEM_STATUSES, 0)
+        self._counts_written_at = time.monotonic()
         if not self._db:
             return
 
+        data = {
+            "ast_name": self.name,
+            "user_id": user_id,
+            "host_user": username,
+            "policy_count": item_count,
+            "status": "running",
+            "started_at": started_at.isoformat(),
+            "entity_type": "EXECUTION",
+        }
+        self._sink().put(partial(self._put_execution_record, data))
+
+    def _put_execution_record(self, data: dict[str, Any]) -> None:
+        """Write the initial execution record (runs on the sink thread)."""
         try:
             self._db.put_execution(
                 session_id=self._session_id,
                 execution_id=self._execution_id,
-                data={
-                    "ast_name": self.name,
-                    "user_id": user_id,
-                    "host_user": username,
-                    "policy_count": item_count,
-                    "status": "running",
-                    "started_at": started_at.isoformat(),
-                    "entity_type": "EXECUTION",
-                },
+                data=data,
             )
             log.info(
                 "Created execution record",
                 execution_id=self._execution_id,
-                user_id=user_id,
+                user_id=data["user_id"],
             )
         except Exception as e:  # pragma: no cover - defensive logging
             log.warning("Failed to create execution record", error=str(e))
 
-    def _update_execution_record(
+    def _finalize_execution_record(
         self,
         status: str,
         message: str,
-        item_results: list[ItemResult],
+        results: ItemResultAccumulator,
         error: Optional[str] = None,
+        completed_at: datetime | None = None,
     ) -> None:
-        """Update execution record with final status."""
+        """Update execution record with final status.
+
+        :meth:`_append_execution_rows` keeps the counts roughly current while
+        the run goes; the final counts come from ``results`` so they match
+        the returned result even if a batch write failed. Call after
+        :meth:`_drain_io`.
+        """
         if not self._db:
             return
 
         try:
             updates: dict[str, Any] = {
                 "status": status,
-                "completed_at": datetime.now().isoformat(),
+                "completed_at": (completed_at or datetime.now()).isoformat(),
                 "message": message,
             }
-
+            updates.update(
+                (f"{item_status}_count", getattr(results, item_status))
+                for item_status in _ITEM_STATUSES
+            )
             if error:
                 updates["error"] = error
-            else:
-                updates["success_count"] = sum(
-                    1 for r in item_results if r.status == "success"
-                )
-                updates["failed_count"] = sum(
-                    1 for r in item_results if r.status == "failed"
-                )
-                updates["skipped_count"] = sum(
-                    1 for r in item_results if r.status == "skipped"
-                )
 
             self._db.update_execution(
                 session_id=self._session_id,
@@ -518,13 +808,11 @@ class AST(ABC):
 
             # Verify we reached expected screen
             if expected_keywords_after_login:
-                for keyword in expected_keywords_after_login:
-                    if host.wait_for_text(keyword):
-                        log.info("Authentication successful", keyword=keyword)
-                        screenshots.append(
-                            host.show_screen("Authentication Successful")
-                        )
-                        return True, "", screenshots
+                keyword = host.wait_for_any(expected_keywords_after_login)
+                if keyword is not None:
+                    log.info("Authentication successful", keyword=keyword)
+                    screenshots.append(host.show_screen("Authentication Successful"))
+                    return True, "", screenshots
 
                 error_msg = f"Authentication may have failed - expected keywords not found: {expected_keywords_after_login}"
                 log.error(error_msg)
@@ -624,16 +912,20 @@ class AST(ABC):
         item_id: str,
         status: Literal["success", "failed", "skipped"],
         item_start: datetime,
-        item_results: list[ItemResult],
+        item_end: datetime,
+        duration_ms: int,
+        results: ItemResultAccumulator,
         current: int,
         total: int,
         error: Optional[str] = None,
         item_data: Optional[dict] = None,
+        stage_ms: dict[str, int] | None = None,
     ) -> int:
-        """Record an item result, report, and persist."""
-        item_end = datetime.now()
-        duration_ms = int((item_end - item_start).total_seconds() * 1000)
+        """Record an item result, report, and persist.
 
+        Timestamps and duration are measured by the thread that ran the
+        item, so they stay accurate when recording happens elsewhere.
+        """
         item_result = ItemResult(
             item_id=item_id,
             status=status,
@@ -643,7 +935,7 @@ class AST(ABC):
             error=error,
             data=item_data or {},
         )
-        item_results.append(item_result)
+        results.add(item_result, current - 1)
 
         self.report_item_result(
             item_id=item_id,
@@ -663,13 +955,26 @@ class AST(ABC):
             item_data=item_data,
         )
 
-        message = f"Item {current}/{total}: "
+        counts = (results.success, results.failed, results.skipped)
         if status == "success":
-            message += "Completed"
+            message = _ITEM_MESSAGES[status] % (current, total, *counts)
+            self._item_log.info(
+                "Item completed successfully",
+                item=item_id,
+                duration_ms=duration_ms,
+                **(stage_ms or {}),
+            )
         elif status == "failed":
-            message += f"Failed - {error}"
+            message = _ITEM_MESSAGES[status] % (current, total, error, *counts)
+            self._item_log.warning(
+                "Item failed",
+                item=item_id,
+                error=error,
+                duration_ms=duration_ms,
+                **(stage_ms or {}),
+            )
         else:
-            message += "Skipped"
+            message = _ITEM_MESSAGES[status] % (current, total, *counts)
 
         self.report_progress(
             current=current,
@@ -681,14 +986,274 @@ class AST(ABC):
 
         return duration_ms
 
+    def _process_one(
+        self,
+        host: "Host",
+        item_id: str,
+        is_valid: bool,
+        item: Any,
+        idx: int,
+        total: int,
+        username: str,
+        password: str,
+        record: Callable[..., Any],
+        all_screenshots: MutableSequence[str],
+        keep_success_screenshots: bool = True,
+    ) -> None:
+        """Run the full login/process/logoff cycle for one item on ``host``.
+
+        The outcome is handed to ``record`` with the keyword arguments of
+        :meth:`_record_item_result` (minus ``results``/``total``), so the
+        caller decides which thread records it. Login screenshots are always
+        kept on failure; ``keep_success_screenshots`` decides the rest.
+        """
+        item_start = datetime.now()
+        item_start_ns = time.perf_counter_ns()
+
+        def finish(
+            status: Literal["success", "failed", "skipped"], **outcome: Any
+        ) -> None:
+            # One clock read per completion gives both the duration and
+            # the end timestamp, so the two always agree
+            elapsed_us = (time.perf_counter_ns() - item_start_ns) // 1_000
+            record(
+                item_id=item_id,
+                status=status,
+                item_start=item_start,
+                item_end=item_start + timedelta(microseconds=elapsed_us),
+                duration_ms=elapsed_us // 1_000,
+                current=idx + 1,
+                **outcome,
+            )
+
+        if not is_valid:
+            finish("skipped", error="Invalid item")
+            return
+
+        needs_login = host not in self._authenticated_hosts
+        if needs_login:
+            self._maybe_report_progress(
+                current=idx + 1,
+                total=total,
+                current_item=item_id,
+                item_status="running",
+                message=f"Item {idx + 1}/{total}: Logging in",
+            )
+
+        # Per-stage timings, emitted once with the item's outcome
+        stage_ms: dict[str, int] = {}
+        try:
+            if needs_login:
+                stage_start = time.perf_counter_ns()
+                success, error, screenshots = self.authenticate(
+                    host,
+                    user=username,
+                    password=password,
+                    expected_keywords_after_login=self.auth_expected_keywords,
+                    application=self.auth_application,
+                    group=self.auth_group,
+                )
+                if screenshots and (keep_success_screenshots or not success):
+                    all_screenshots.extend(screenshots)
+                stage_ms["login_ms"] = (time.perf_counter_ns() - stage_start) // 1_000_000
+                if not success:
+                    raise Exception(f"Login failed: {error}")
+                self._authenticated_hosts.add(host)
+
+            self._maybe_report_progress(
+                current=idx + 1,
+                total=total,
+                current_item=item_id,
+                item_status="running",
+                message=f"Item {idx + 1}/{total}: Processing",
+            )
+            stage_start = time.perf_counter_ns()
+            success, error, item_data = self.process_single_item(
+                host, item, idx + 1, total
+            )
+            stage_ms["process_ms"] = (time.perf_counter_ns() - stage_start) // 1_000_000
+            if not success:
+                raise Exception(f"Process failed: {error}")
+
+            finish("success", item_data=item_data, stage_ms=stage_ms)
+
+        except Exception as e:
+            error_screen = None
+            try:
+                error_screen = host.get_formatted_screen(show_row_numbers=False)
+            except Exception:
+                pass
+
+            finish(
+                "failed",
+                error=str(e),
+                item_data=({"errorScreen": error_screen} if error_screen else None),
+                stage_ms=stage_ms,
+            )
+
+            # Start the next item on this host from a fresh login; a lost
+            # session has nothing to log off, so skip the sign-off waits
+            self._authenticated_hosts.discard(host)
+            try:
+                if host.is_connected:
+                    self.logoff(host)
+            except Exception:
+                self._item_log.warning("Recovery logoff failed", item=item_id)
+            return
+
+        if self._full_cycle_per_item and host in self._authenticated_hosts:
+            self._authenticated_hosts.discard(host)
+            try:
+                _, _, screenshots = self.logoff(host)
+                if keep_success_screenshots:
+                    all_screenshots.extend(screenshots)
+            except Exception:
+                self._item_log.warning("Logoff failed", item=item_id)
+
+    def _logoff_sessions(self, all_screenshots: MutableSequence[str]) -> None:
+        """Log off every host session still signed in after the item loop."""
+        while self._authenticated_hosts:
+            host = self._authenticated_hosts.pop()
+            try:
+                success, error, screenshots = self.logoff(host)
+                if screenshots:
+                    all_screenshots.extend(screenshots)
+                if not success:
+                    log.warning("Logoff failed", error=error)
+            except Exception as e:
+                log.warning("Logoff failed", error=str(e))
+
+    def _execute_parallel(
+        self,
+        hosts: list["Host"],
+        prepared: list[tuple[str, bool, Any]],
+        username: str,
+        password: str,
+        results: ItemResultAccumulator,
+        all_screenshots: MutableSequence[str],
+    ) -> None:
+        """Process items concurrently, one long-lived worker per host session.
+
+        Each worker takes a host for the whole batch, so it logs in once and
+        then pulls items off a shared work queue. Outcomes travel back over
+        a result queue and are recorded on the calling thread, which keeps
+        item results and persistence out of the workers; only throttled
+        "running" updates (:meth:`_maybe_report_progress`) come from them.
+        """
+        total = len(prepared)
+        # LIFO so a returned session is the next one handed out, keeping the
+        # working set small when there are more hosts than items; seeded in
+        # reverse so hosts are first taken in the order given
+        available: queue.LifoQueue[Host] = queue.LifoQueue()
+        for pooled_host in reversed(hosts):
+            available.put(pooled_host)
+
+        max_workers = min(len(hosts), total, _max_parallel_workers())
+        # Seeded up front, with one stop sentinel per worker after the items
+        work_queue: queue.Queue[tuple[int, tuple[str, bool, Any]] | None] = (
+            queue.Queue()
+        )
+        for entry in enumerate(prepared):
+            work_queue.put(entry)
+        for _ in range(max_workers):
+            work_queue.put(None)
+        # Item outcomes (kwargs for _record_item_result); a worker's exit is
+        # marked by putting its own list of screenshots. Bounded so workers
+        # block (backpressure) if recording falls behind.
+        result_queue: queue.Queue[dict[str, Any] | list[str]] = queue.Queue(
+            maxsize=2 * max_workers
+        )
+
+        def record(**outcome: Any) -> None:
+            result_queue.put(outcome)
+
+        def worker() -> None:
+            host = available.get()
+            screenshots: list[str] = []
+            # Bound once per worker rather than looked up per item
+            wait_if_paused = self.wait_if_paused
+            next_entry = work_queue.get
+            process_one = self._process_one
+            keep_success_screenshots = self.capture_screenshots_parallel
+            try:
+                # Cancellation is observed between items, so it takes at most
+                # one in-flight item per worker to wind down
+                while wait_if_paused():
+                    entry = next_entry()
+                    if entry is None:
+                        break
+                    idx, (item_id, is_valid, item) = entry
+                    process_one(
+                        host,
+                        item_id,
+                        is_valid,
+                        item,
+                        idx,
+                        total,
+                        username,
+                        password,
+                        record,
+                        screenshots,
+                        keep_success_screenshots,
+                    )
+            finally:
+                available.put(host)
+                result_queue.put(screenshots)
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=f"ast-{self.name}"
+        ) as executor:
+            workers = [executor.submit(worker) for _ in range(max_workers)]
+            running = max_workers
+            record_result = partial(
+                self._record_item_result, results=results, total=total
+            )
+            batch: deque[dict[str, Any] | list[str]] = deque()
+            try:
+                while running:
+                    # Block for one entry, then take whatever else is ready
+                    batch.append(result_queue.get())
+                    while len(batch) < _RESULT_DRAIN_BATCH:
+                        try:
+                            batch.append(result_queue.get_nowait())
+                        except queue.Empty:
+                            break
+                    while batch:
+                        outcome = batch.popleft()
+                        if isinstance(outcome, list):
+                            all_screenshots.extend(outcome)
+                            running -= 1
+                        else:
+                            record_result(**outcome)
+            except BaseException:
+                # Recording failed: stop the workers and keep draining until
+                # each has exited, or one blocked on the bounded queue would
+                # hang the executor's shutdown
+                self.cancel()
+                running -= sum(isinstance(outcome, list) for outcome in batch)
+                while running:
+                    if isinstance(result_queue.get(), list):
+                        running -= 1
+                raise
+            for future in workers:
+                future.result()
+
     # ------------------------------------------------------------------ #
     # Execute
     # ------------------------------------------------------------------ #
     def execute(self, host: "Host", **kwargs: Any) -> ASTResult:
         """
-        Default execute implementation: login, process each item, logoff.
-        Subclasses may override, but typically only implement process_single_item/logoff.
+        Default execute implementation: login once, process each item, logoff.
+        A failed item logs the session off so the next item starts from a
+        fresh login. Subclasses may override, but typically only implement
+        process_single_item/logoff.
+
+        Pass ``hosts=[...]`` with more than one session to process items
+        concurrently, one item per host at a time. ``fullCyclePerItem=True``
+        restores the old login/process/logoff cycle for every item.
         """
+        hosts: list[Host] = kwargs.pop("hosts", None) or [host]
+        self._full_cycle_per_item = bool(kwargs.get("fullCyclePerItem"))
         username = kwargs.get("username")
         password = kwargs.get("password")
         raw_items: list[Any] = self.prepare_items(**kwargs)
@@ -696,29 +1261,32 @@ class AST(ABC):
         self._session_id = kwargs.get("sessionId", self._execution_id)
 
         if not username or not password:
+            now = datetime.now()
             return ASTResult(
                 status=ASTStatus.FAILED,
-                started_at=datetime.now(),
-                completed_at=datetime.now(),
+                started_at=now,
+                completed_at=now,
                 message="Missing required parameters: username and password are required",
                 error="ValidationError: username and password must be provided",
             )
 
+        started_at = datetime.now()
         result = ASTResult(
             status=ASTStatus.RUNNING,
-            started_at=datetime.now(),
+            started_at=started_at,
             data={"username": username, "policyCount": len(raw_items)},
         )
 
-        all_screenshots: list[str] = []
-        item_results: list[ItemResult] = []
+        # Newest screens win once the cap is hit, so error states survive
+        all_screenshots: deque[str] = deque(maxlen=self.max_screenshots)
+        results = ItemResultAccumulator([None] * len(raw_items))
 
         self._init_db()
         self._create_execution_record(
             username,
             app_user_id,
             len(raw_items),
-            result.started_at or datetime.now(),
+            started_at,
         )
 
         try:
@@ -726,128 +1294,64 @@ class AST(ABC):
                 log.info("No items to process, returning early")
                 result.status = ASTStatus.SUCCESS
                 result.message = "No items to process"
+                self._drain_io()
                 return result
 
             total = len(raw_items)
-            log.info(f"Processing {total} items (full cycle each)...")
-
-            for idx, item in enumerate(raw_items):
-                if not self.wait_if_paused():
+            log.info(f"Processing {total} items...")
+
+            # Resolve ids and validity once, outside the per-item cycle
+            get_item_id = self.get_item_id
+            validate_item = self.validate_item
+            prepared = [
+                (get_item_id(item), validate_item(item), item) for item in raw_items
+            ]
+
+            if len(hosts) > 1:
+                self._execute_parallel(
+                    hosts,
+                    prepared,
+                    username,
+                    password,
+                    results,
+                    all_screenshots,
+                )
+                if self.is_cancelled:
                     log.info("AST cancelled by user")
                     result.status = ASTStatus.CANCELLED
                     result.message = "Cancelled by user"
-                    break
-
-                item_id = self.get_item_id(item)
-                item_start = datetime.now()
-                self.report_progress(
-                    current=idx + 1,
-                    total=total,
-                    current_item=item_id,
-                    item_status="running",
-                    message=f"Item {idx + 1}/{total}: Logging in",
+            else:
+                wait_if_paused = self.wait_if_paused
+                process_one = self._process_one
+                record = partial(
+                    self._record_item_result, results=results, total=total
                 )
-
-                if not self.validate_item(item):
-                    self._record_item_result(
-                        item_id=item_id,
-                        status="skipped",
-                        item_start=item_start,
-                        item_results=item_results,
-                        current=idx + 1,
-                        total=total,
-                        error="Invalid item",
-                    )
-                    continue
-
-                try:
-                    success, error, screenshots = self.authenticate(
+                for idx, (item_id, is_valid, item) in enumerate(prepared):
+                    if not wait_if_paused():
+                        log.info("AST cancelled by user")
+                        result.status = ASTStatus.CANCELLED
+                        result.message = "Cancelled by user"
+                        break
+
+                    process_one(
                         host,
-                        user=username,
-                        password=password,
-                        expected_keywords_after_login=self.auth_expected_keywords,
-                        application=self.auth_application,
-                        group=self.auth_group,
-                    )
-                    all_screenshots.extend(screenshots)
-                    if not success:
-                        raise Exception(f"Login failed: {error}")
-
-                    self.report_progress(
-                        current=idx + 1,
-                        total=total,
-                        current_item=item_id,
-                        item_status="running",
-                        message=f"Item {idx + 1}/{total}: Processing",
-                    )
-                    success, error, item_data = self.process_single_item(
-                        host, item, idx + 1, total
-                    )
-                    if not success:
-                        raise Exception(f"Process failed: {error}")
-
-                    self.report_progress(
-                        current=idx + 1,
-                        total=total,
-                        current_item=item_id,
-                        item_status="running",
-                        message=f"Item {idx + 1}/{total}: Logging off",
-                    )
-                    success, error, screenshots = self.logoff(host)
-                    all_screenshots.extend(screenshots)
-                    if not success:
-                        raise Exception(f"Logoff failed: {error}")
-
-                    duration_ms = self._record_item_result(
-                        item_id=item_id,
-                        status="success",
-                        item_start=item_start,
-                        item_results=item_results,
-                        current=idx + 1,
-                        total=total,
-                        item_data=item_data,
-                    )
-                    log.info(
-                        "Item completed successfully",
-                        item=item_id,
-                        duration_ms=duration_ms,
-                    )
-
-                except Exception as e:
-                    error_screen = None
-                    try:
-                        error_screen = host.get_formatted_screen(show_row_numbers=False)
-                    except Exception:
-                        pass
-
-                    duration_ms = self._record_item_result(
-                        item_id=item_id,
-                        status="failed",
-                        item_start=item_start,
-                        item_results=item_results,
-                        current=idx + 1,
-                        total=total,
-                        error=str(e),
-                        item_data=(
-                            {"errorScreen": error_screen} if error_screen else None
-                        ),
-                    )
-                    log.warning(
-                        "Item failed",
-                        item=item_id,
-                        error=str(e),
-                        duration_ms=duration_ms,
+                        item_id,
+                        is_valid,
+                        item,
+                        idx,
+                        total,
+                        username,
+                        password,
+                        record,
+                        all_screenshots,
                     )
 
-                    try:
-                        log.info("Attempting recovery logoff...")
-                        self.logoff(host)
-                    except Exception:
-                        log.warning("Recovery logoff failed, continuing...")
+            self._logoff_sessions(all_screenshots)
+            self._drain_io()
 
-            success_count = sum(1 for r in item_results if r.status == "success")
-            failed_count = sum(1 for r in item_results if r.status == "failed")
-            skipped_count = sum(1 for r in item_results if r.status == "skipped")
+            success_count = results.success
+            failed_count = results.failed
+            skipped_count = results.skipped
 
             if not self.is_cancelled:
                 result.status = ASTStatus.SUCCESS
@@ -855,7 +1359,7 @@ class AST(ABC):
                     f"Processed {total} items "
                     f"({success_count} success, {failed_count} failed, {skipped_count} skipped)"
                 )
-            result.item_results = item_results
+            result.item_results = results.recorded()
             result.data.update(
                 {
                     "successCount": success_count,
@@ -864,16 +1368,23 @@ class AST(ABC):
                 }
             )
 
-            result.screenshots = all_screenshots
+            result.screenshots = list(all_screenshots)
+            result.completed_at = datetime.now()
 
             if self.is_cancelled:
-                self._update_execution_record(
-                    "cancelled", result.message or "Cancelled by user", item_results
+                self._finalize_execution_record(
+                    "cancelled",
+                    result.message or "Cancelled by user",
+                    results,
+                    completed_at=result.completed_at,
                 )
                 log.info("AST cancelled", username=username)
             else:
-                self._update_execution_record(
-                    "success", result.message or "", item_results
+                self._finalize_execution_record(
+                    "success",
+                    result.message or "",
+                    results,
+                    completed_at=result.completed_at,
                 )
                 log.info("AST completed successfully", username=username)
 
@@ -885,11 +1396,18 @@ class AST(ABC):
                 all_screenshots.append(host.show_screen("Error State"))
             except Exception:
                 pass
-            result.screenshots = all_screenshots
-            result.item_results = item_results
+            result.item_results = results.recorded()
 
-            self._update_execution_record(
-                "failed", result.message, item_results, error=str(e)
+            self._logoff_sessions(all_screenshots)
+            result.screenshots = list(all_screenshots)
+            self._drain_io()
+            result.completed_at = datetime.now()
+            self._finalize_execution_record(
+                "failed",
+                result.message,
+                results,
+                error=str(e),
+                completed_at=result.completed_at,
             )
             log.exception("AST failed", username=username)
 
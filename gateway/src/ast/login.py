@@ -4,16 +4,17 @@
 """
 Automated login script for TK4- MVS system.
 
-This AST performs a complete login/logoff cycle for each policy:
+This AST runs three phases:
 1. Phase 1: Login (Wait for Logon screen, enter credentials, navigate to TSO)
-2. Phase 2: Process policy number
+2. Phase 2: Process each policy number
 3. Phase 3: Logoff (Exit TSO and logoff)
 
-Each policy gets its own full login/logoff cycle.
+The session stays signed in across policies; a failed policy triggers a
+logoff so the next one starts from a fresh login.
 """
 
+import re
 import time
-from datetime import datetime
 from typing import TYPE_CHECKING, Any, Literal
 
 import structlog
@@ -23,24 +24,33 @@ from .base import AST
 if TYPE_CHECKING:
     from ..services.tn3270.host import Host
 
+__all__ = ("LoginAST", "validate_policy_number")
+
 log = structlog.get_logger()
 
 PolicyStatus = Literal["success", "failed", "skipped"]
 
+# Exit Menu polling during sign-off (seconds)
+_EXIT_MENU_INITIAL_WAIT = 0.1
+_EXIT_MENU_MAX_WAIT = 1.0
+_EXIT_MENU_DEADLINE = 20.0
+
+
+_POLICY_NUMBER_MATCH = re.compile(r"[A-Za-z0-9]{9}").fullmatch
+
 
 def validate_policy_number(policy_number: str) -> bool:
     """Validate a policy number format (9 char alphanumeric)."""
-    return bool(policy_number and len(policy_number) == 9 and policy_number.isalnum())
+    return _POLICY_NUMBER_MATCH(policy_number) is not None
 
 
 class LoginAST(AST):
     """
     Automated login to TK4- TSO system.
 
-    Performs a complete login/logoff cycle for each policy number.
-    Each policy goes through all three phases:
+    Logs in once, processes every policy number, then logs off:
     - Phase 1: Login
-    - Phase 2: Process policy
+    - Phase 2: Process policy (per policy)
     - Phase 3: Logoff
 
     Required parameters:
@@ -52,13 +62,17 @@ class LoginAST(AST):
     """
 
     name = "login"
-    description = "Login to TSO and process policies (full cycle per policy)"
+    description = "Login to TSO and process policies"
 
     # Authentication configuration for Fire system
     auth_expected_keywords = ["Fire System Selection"]
     auth_application = "FIRE06"
     auth_group = "@OOFIRE"
 
+    # Seconds to sleep per policy to stand in for real lookup work; off by
+    # default so workers and host sessions are not held idle
+    simulate_delay: float = 0
+
     def _phase2_process_policy(
         self, host: "Host", policy_number: str
     ) -> tuple[bool, str, dict[str, Any]]:
@@ -76,8 +90,9 @@ class LoginAST(AST):
         # 3. Read the policy data
         # 4. Extract relevant information
 
-        # For now, simulate processing with a small delay
-        time.sleep(0.5)  # Simulate processing time
+        # For now, optionally simulate processing time
+        if self.simulate_delay:
+            time.sleep(self.simulate_delay)
 
         policy_data = {
             "policyNumber": policy_number,
@@ -100,12 +115,14 @@ class LoginAST(AST):
             True if sign-off successful, False otherwise
         """
         log.info("🔒 Signing off from terminal session...")
-        max_backoff_count = 20
-        while (
-            not host.wait_for_text("Exit Menu", timeout=0.8) and max_backoff_count > 0
-        ):
+        # Back off exponentially so a prompt Exit Menu is seen within ~0.1s
+        delay = _EXIT_MENU_INITIAL_WAIT
+        deadline = time.monotonic() + _EXIT_MENU_DEADLINE
+        while not host.wait_for_text("Exit Menu", timeout=delay):
+            if time.monotonic() >= deadline:
+                break
             host.pf(15)
-            max_backoff_count -= 1
+            delay = min(delay * 2, _EXIT_MENU_MAX_WAIT)
 
         host.show_screen("Exit Menu")
         host.fill_field_at_position(36, 5, "1")
@@ -114,41 +131,19 @@ class LoginAST(AST):
 
         # Check for target screen or default SIGNON
         target_keywords = target_screen_keywords or ["**** SIGNON ****", "SIGNON"]
-        for keyword in target_keywords:
-            if host.wait_for_text(keyword, timeout=10):
-                log.info("✅ Signed off successfully.", keyword=keyword)
-                return True
+        keyword = host.wait_for_any(target_keywords, timeout=10)
+        if keyword is not None:
+            log.info("✅ Signed off successfully.", keyword=keyword)
+            return True
 
         log.warning("Failed to reach expected sign-off screen")
         return False
 
     def logoff(self, host: "Host", target_screen_keywords: list[str] | None = None) -> tuple[bool, str, list[str]]:
         """Implement abstract logoff using sign_off."""
-        screenshots: list[str] = []
-
-        log.info("🔒 Signing off from terminal session...")
-        max_backoff_count = 20
-        while (
-            not host.wait_for_text("Exit Menu", timeout=0.8) and max_backoff_count > 0
-        ):
-            host.pf(15)
-            max_backoff_count -= 1
-
-        host.show_screen("Exit Menu")
-        host.fill_field_at_position(36, 5, "1")
-        host.show_screen("Confirm Exit")
-        host.enter()
-
-        # Check for target screen or default SIGNON
-        target_keywords = target_screen_keywords or ["**** SIGNON ****", "SIGNON"]
-        for keyword in target_keywords:
-            if host.wait_for_text(keyword, timeout=10):
-                log.info("✅ Signed off successfully.", keyword=keyword)
-                screenshots.append(host.show_screen("Signed Off"))
-                return True, "", screenshots
-
-        screenshots.append(host.show_screen("Sign Off Failed"))
-        return False, "Failed to sign off", screenshots
+        if self.sign_off(host, target_screen_keywords):
+            return True, "", [host.show_screen("Signed Off")]
+        return False, "Failed to sign off", [host.show_screen("Sign Off Failed")]
 
     def validate_item(self, item: Any) -> bool:
         return validate_policy_number(str(item))
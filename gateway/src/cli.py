@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import sys
 from pathlib import Path
 from typing import Final
@@ -14,19 +15,27 @@ TESTS_DIR: Final = PROJECT_ROOT / "tests"
 SRC_DIR: Final = PROJECT_ROOT / "src"
 
 
+def _pytest_args(*extra: str) -> list[str]:
+    """Base pytest arguments; CI runs skip the throwaway .pytest_cache writes."""
+    args = [str(TESTS_DIR), "-v", *extra]
+    if os.getenv("CI"):
+        args += ["-p", "no:cacheprovider"]
+    return args
+
+
 def run_tests() -> None:
     """Execute the test suite using pytest."""
-    sys.exit(pytest.main([str(TESTS_DIR), "-v"]))
+    sys.exit(pytest.main(_pytest_args()))
 
 
 def run_coverage() -> None:
     """Execute the suite while collecting coverage data."""
     sys.exit(
-        pytest.main([
-            str(TESTS_DIR),
-            "-v",
-            f"--cov={SRC_DIR}",
-            "--cov-report=html",
-            "--cov-report=term-missing",
-        ])
+        pytest.main(
+            _pytest_args(
+                f"--cov={SRC_DIR}",
+                "--cov-report=html",
+                "--cov-report=term-missing",
+            )
+        )
     )
@@ -9,12 +9,19 @@ Channel naming conventions:
 - tn3270.output.<id>     - Output from TN3270 (terminal output)
 """
 
+from functools import lru_cache
 
+# Session ids are long-lived, so the names are formatted once per session
+_CHANNEL_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=_CHANNEL_CACHE_SIZE)
 def get_tn3270_input_channel(session_id: str) -> str:
     """Get the input channel for a TN3270 session."""
     return f"tn3270.input.{session_id}"
 
 
+@lru_cache(maxsize=_CHANNEL_CACHE_SIZE)
 def get_tn3270_output_channel(session_id: str) -> str:
     """Get the output channel for a TN3270 session."""
     return f"tn3270.output.{session_id}"
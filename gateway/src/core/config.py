@@ -4,6 +4,7 @@
 
 import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 from dotenv import load_dotenv
 
@@ -65,12 +66,7 @@ class Config:
     dynamodb: DynamoDBConfig = field(default_factory=DynamoDBConfig)
 
 
-_config: Config | None = None
-
-
+@lru_cache(maxsize=1)
 def get_config() -> Config:
     """Get application configuration (singleton)."""
-    global _config
-    if _config is None:
-        _config = Config()
-    return _config
+    return Config()
@@ -15,19 +15,68 @@ EXECUTION#<execId>    POLICY#<policyNum>        Execution's policy result
 
 GSI1: GSI1PK (email) for user lookup by email
 GSI2: GSI2PK (USER#<userId>#DATE#<date>), GSI2SK (started_at) for user's executions by date
+GSI3: execution_id for execution (and policy) lookup by execution id
 """
 
+import threading
+import time
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 import boto3
 import structlog
-from boto3.dynamodb.conditions import Key
+from boto3.dynamodb.conditions import Attr, Key
+from boto3.dynamodb.types import TypeSerializer
+from botocore.config import Config
 
 from ..core.config import DynamoDBConfig
 
 log = structlog.get_logger()
 
+# BatchWriteItem accepts at most this many requests per call
+_BATCH_WRITE_LIMIT = 25
+# Attempts at a batch while DynamoDB keeps returning unprocessed items
+_BATCH_WRITE_MAX_ATTEMPTS = 10
+
+# Enough pooled connections for parallel AST workers plus the sink, and
+# client-side adaptive retry/backoff
+_BOTO_CONFIG = Config(
+    max_pool_connections=50,
+    retries={"max_attempts": 10, "mode": "adaptive"},
+)
+
+
+_serialize = TypeSerializer().serialize
+
+
+def _marshal(value: Any) -> dict[str, Any]:
+    """AttributeValue for ``value``; str/int skip TypeSerializer's dispatch."""
+    value_type = type(value)
+    if value_type is str:
+        return {"S": value}
+    if value_type is int:
+        return {"N": str(value)}
+    return _serialize(value)
+
+
+@lru_cache(maxsize=128)
+def _update_expression(
+    attrs: tuple[str, ...],
+) -> tuple[str, dict[str, str], tuple[str, ...]]:
+    """SET expression, attribute names and value placeholders for ``attrs``.
+
+    Updates repeat a handful of attribute sets (status, counts, completion),
+    so the expression is built once per set. The names dict is shared
+    between calls and must not be mutated.
+    """
+    value_keys = tuple(f":val{i}" for i in range(len(attrs)))
+    names = {f"#attr{i}": attr for i, attr in enumerate(attrs)}
+    expression = "SET " + ", ".join(
+        f"{name} = {value}" for name, value in zip(names, value_keys, strict=True)
+    )
+    return expression, names, value_keys
+
 
 # Key prefixes for single table design
 class KeyPrefix:
@@ -51,14 +100,11 @@ class DynamoDBClient:
             region_name=config.region,
             aws_access_key_id=config.access_key_id,
             aws_secret_access_key=config.secret_access_key,
+            config=_BOTO_CONFIG,
         )
-        self._client = boto3.client(
-            "dynamodb",
-            endpoint_url=config.endpoint,
-            region_name=config.region,
-            aws_access_key_id=config.access_key_id,
-            aws_secret_access_key=config.secret_access_key,
-        )
+        # Low-level client of the resource: shares its session, service model
+        # and connection pool (describe_table, pre-marshalled batch writes)
+        self._client = self._resource.meta.client
         self._table = self._resource.Table(config.table_name)  # type: ignore[attr-defined]
 
         # Validate connection by describing the table
@@ -84,6 +130,46 @@ class DynamoDBClient:
         """Put an item into the table."""
         self._table.put_item(Item=item)
 
+    def batch_put_items(self, items: list[dict[str, Any]]) -> None:
+        """Put many items using BatchWriteItem, 25 per request.
+
+        A batch may not repeat a key, so the last item for each PK/SK wins.
+        """
+        unique = list({(item["PK"], item["SK"]): item for item in items}.values())
+        for start in range(0, len(unique), _BATCH_WRITE_LIMIT):
+            self._batch_write(
+                [
+                    {"PutRequest": {"Item": item}}
+                    for item in unique[start : start + _BATCH_WRITE_LIMIT]
+                ]
+            )
+
+    def _batch_write(
+        self, requests: list[dict[str, Any]], marshalled: bool = False
+    ) -> None:
+        """Issue one BatchWriteItem, retrying unprocessed items with backoff.
+
+        ``marshalled`` requests already hold AttributeValues and go through
+        the low-level client; others go through the resource's serializer.
+        """
+        write = (
+            self._client.batch_write_item
+            if marshalled
+            else self._resource.batch_write_item
+        )
+        pending: dict[str, Any] = {self._table_name: requests}
+        for attempt in range(_BATCH_WRITE_MAX_ATTEMPTS):
+            response = write(RequestItems=pending)
+            pending = response.get("UnprocessedItems") or {}
+            if not pending:
+                return
+            time.sleep(min(2**attempt * 0.05, 2.0))
+        unprocessed = sum(len(reqs) for reqs in pending.values())
+        raise RuntimeError(
+            f"{unprocessed} items still unprocessed after "
+            f"{_BATCH_WRITE_MAX_ATTEMPTS} BatchWriteItem attempts"
+        )
+
     def get_item(self, pk: str, sk: str) -> dict[str, Any] | None:
         """Get an item by primary key (PK + SK)."""
         response = self._table.get_item(Key={"PK": pk, "SK": sk})
@@ -96,19 +182,10 @@ class DynamoDBClient:
         updates: dict[str, Any],
     ) -> dict[str, Any]:
         """Update an item with given attributes."""
-        # Build update expression
-        update_parts = []
-        expression_values = {}
-        expression_names = {}
-
-        for i, (attr, value) in enumerate(updates.items()):
-            placeholder = f":val{i}"
-            name_placeholder = f"#attr{i}"
-            update_parts.append(f"{name_placeholder} = {placeholder}")
-            expression_values[placeholder] = value
-            expression_names[name_placeholder] = attr
-
-        update_expression = "SET " + ", ".join(update_parts)
+        update_expression, expression_names, value_keys = _update_expression(
+            tuple(updates)
+        )
+        expression_values = dict(zip(value_keys, updates.values(), strict=True))
 
         response = self._table.update_item(
             Key={"PK": pk, "SK": sk},
@@ -304,8 +381,6 @@ class DynamoDBClient:
         Returns:
             Tuple of (executions, next_cursor)
         """
-        from boto3.dynamodb.conditions import Attr
-
         gsi2pk = f"{KeyPrefix.USER}{user_id}#DATE#{date}"
 
         filter_expr = None
@@ -322,20 +397,26 @@ class DynamoDBClient:
 
     def get_execution_by_id(self, execution_id: str) -> dict[str, Any] | None:
         """
-        Get an execution by its ID.
+        Get an execution by its ID (via GSI3).
 
-        Since we don't know the session_id, we need to do a GSI lookup or scan.
-        For now, we'll query by execution_id prefix in PK.
+        GSI3 is keyed on execution_id and also holds the execution's policy
+        results, so the execution record is picked out with a filter on SK.
+        No Limit is passed: DynamoDB applies it before the filter.
         """
-        # Query using execution_id as PK prefix (for policy lookups)
-        # We need to find the execution record which has PK=SESSION#... and SK=EXECUTION#<id>
-        # This requires a scan with filter, which is not ideal but works for now
-        response = self._table.scan(
-            FilterExpression=Key("SK").eq(f"{KeyPrefix.EXECUTION}{execution_id}"),
-            Limit=1,
-        )
-        items = response.get("Items", [])
-        return items[0] if items else None
+        kwargs: dict[str, Any] = {
+            "IndexName": "GSI3",
+            "KeyConditionExpression": Key("execution_id").eq(execution_id),
+            "FilterExpression": Attr("SK").eq(f"{KeyPrefix.EXECUTION}{execution_id}"),
+        }
+        while True:
+            response = self._table.query(**kwargs)
+            items = response.get("Items", [])
+            if items:
+                return items[0]
+            last_key = response.get("LastEvaluatedKey")
+            if not last_key:
+                return None
+            kwargs["ExclusiveStartKey"] = last_key
 
     # -------------------------------------------------------------------------
     # Policy Result Operations
@@ -354,6 +435,37 @@ class DynamoDBClient:
         }
         self.put_item(item)
 
+    def batch_put_policy_results(
+        self, execution_id: str, results: list[tuple[str, dict[str, Any]]]
+    ) -> None:
+        """Create many policy result records for an execution in batches.
+
+        Items are marshalled straight to AttributeValues (keys are fixed by
+        the execution) and written through the low-level client.
+        """
+        pk = {"S": f"{KeyPrefix.EXECUTION}{execution_id}"}
+        execution_attr = {"S": execution_id}
+        # A batch may not repeat a key, so the last result per policy wins
+        latest = dict(results)
+        items = [
+            {
+                "PK": pk,
+                "SK": {"S": f"{KeyPrefix.POLICY}{policy_number}"},
+                "execution_id": execution_attr,
+                "policy_number": {"S": policy_number},
+                **{key: _marshal(value) for key, value in data.items()},
+            }
+            for policy_number, data in latest.items()
+        ]
+        for start in range(0, len(items), _BATCH_WRITE_LIMIT):
+            self._batch_write(
+                [
+                    {"PutRequest": {"Item": item}}
+                    for item in items[start : start + _BATCH_WRITE_LIMIT]
+                ],
+                marshalled=True,
+            )
+
     def get_policy_result(self, execution_id: str, policy_number: str) -> dict[str, Any] | None:
         """Get a specific policy result."""
         return self.get_item(
@@ -364,15 +476,19 @@ class DynamoDBClient:
 
 # Singleton instance
 _client: DynamoDBClient | None = None
+_client_lock = threading.Lock()
 
 
 def get_dynamodb_client(config: DynamoDBConfig | None = None) -> DynamoDBClient:
     """Get the singleton DynamoDB client instance."""
     global _client
     if _client is None:
-        if config is None:
-            from ..core.config import get_config
-
-            config = get_config().dynamodb
-        _client = DynamoDBClient(config)
+        # Start-up and AST threads may race here; build the client only once
+        with _client_lock:
+            if _client is None:
+                if config is None:
+                    from ..core.config import get_config
+
+                    config = get_config().dynamodb
+                _client = DynamoDBClient(config)
     return _client
@@ -7,12 +7,22 @@ from __future__ import annotations
 import json
 from typing import TYPE_CHECKING
 
-from src.models.ast import ASTItemResultMessage, ASTPausedMessage, ASTProgressMessage
-
+from . import ast as ast_models
+from . import data as data_models
+from . import error as error_models
+from . import ping as ping_models
+from . import session as session_models
 from .types import MessageType
 
 if TYPE_CHECKING:
-    from .ast import ASTRunMessage, ASTControlMessage, ASTStatusMessage
+    from .ast import (
+        ASTControlMessage,
+        ASTItemResultMessage,
+        ASTPausedMessage,
+        ASTProgressMessage,
+        ASTRunMessage,
+        ASTStatusMessage,
+    )
     from .data import DataMessage
     from .error import ErrorMessage
     from .ping import PingMessage, PongMessage
@@ -46,18 +56,7 @@ if TYPE_CHECKING:
 
 def parse_message(raw: str | bytes) -> "MessageEnvelope":
     """Parse a raw JSON message into the appropriate message type."""
-    # Import here to avoid circular imports
-    from .ast import ASTRunMessage, ASTControlMessage, ASTStatusMessage
-    from .data import DataMessage
-    from .error import ErrorMessage
-    from .ping import PingMessage, PongMessage
-    from .session import (
-        SessionCreatedMessage,
-        SessionCreateMessage,
-        SessionDestroyedMessage,
-        SessionDestroyMessage,
-    )
-
+    # Submodules are bound once at import; classes are read off them per call
     if isinstance(raw, bytes):
         raw = raw.decode("utf-8")
 
@@ -66,27 +65,27 @@ def parse_message(raw: str | bytes) -> "MessageEnvelope":
 
     match msg_type:
         case MessageType.DATA:
-            return DataMessage.model_validate(data)
+            return data_models.DataMessage.model_validate(data)
         case MessageType.PING:
-            return PingMessage.model_validate(data)
+            return ping_models.PingMessage.model_validate(data)
         case MessageType.PONG:
-            return PongMessage.model_validate(data)
+            return ping_models.PongMessage.model_validate(data)
         case MessageType.ERROR:
-            return ErrorMessage.model_validate(data)
+            return error_models.ErrorMessage.model_validate(data)
         case MessageType.SESSION_CREATE:
-            return SessionCreateMessage.model_validate(data)
+            return session_models.SessionCreateMessage.model_validate(data)
         case MessageType.SESSION_DESTROY:
-            return SessionDestroyMessage.model_validate(data)
+            return session_models.SessionDestroyMessage.model_validate(data)
         case MessageType.SESSION_CREATED:
-            return SessionCreatedMessage.model_validate(data)
+            return session_models.SessionCreatedMessage.model_validate(data)
         case MessageType.SESSION_DESTROYED:
-            return SessionDestroyedMessage.model_validate(data)
+            return session_models.SessionDestroyedMessage.model_validate(data)
         case MessageType.AST_RUN:
-            return ASTRunMessage.model_validate(data)
+            return ast_models.ASTRunMessage.model_validate(data)
         case MessageType.AST_CONTROL:
-            return ASTControlMessage.model_validate(data)
+            return ast_models.ASTControlMessage.model_validate(data)
         case MessageType.AST_STATUS:
-            return ASTStatusMessage.model_validate(data)
+            return ast_models.ASTStatusMessage.model_validate(data)
         case _:
             raise ValueError(f"Unknown message type: {msg_type}")
 
@@ -26,6 +26,12 @@ if TYPE_CHECKING:
 
 log = structlog.get_logger()
 
+# Screen polling schedule for wait_for_any (seconds)
+_POLL_MIN_DELAY = 0.001
+_POLL_LINEAR_STEP = 0.01
+_POLL_LINEAR_LIMIT = 0.1
+_POLL_MAX_DELAY = 0.5
+
 # Field attribute bit masks
 FA_PROTECTED = 0x20
 FA_INTENSIFIED = 0x08
@@ -136,6 +142,11 @@ class Host:
         """Check if keyboard input is inhibited."""
         return bool(self._tnz.pwait)
 
+    @property
+    def is_connected(self) -> bool:
+        """Check that the host session has not been lost."""
+        return not self._tnz.seslost
+
     @property
     def did_screen_update(self) -> bool:
         """Check if screen was updated since last check."""
@@ -816,13 +827,47 @@ class Host:
         Returns:
             True if text appeared, False if timeout.
         """
-        start = time.time()
-        while time.time() - start < timeout:
-            if self.screen_contains(text, case_sensitive):
-                return True
-            time.sleep(0.5)
+        return self.wait_for_any([text], timeout, case_sensitive) is not None
 
-        return False
+    def wait_for_any(
+        self,
+        targets: list[str],
+        timeout: float = 30.0,
+        case_sensitive: bool = False,
+    ) -> str | None:
+        """
+        Wait for any of several texts to appear on screen.
+
+        The screen is read once per poll and checked against every target.
+        Polls start 1ms apart, grow linearly to 100ms, then double up to
+        500ms, so a prompt that is already up is seen almost immediately.
+
+        Args:
+            targets: Texts to wait for
+            timeout: Maximum seconds to wait (default: 30)
+            case_sensitive: Whether the text match is case sensitive (default: False)
+        Returns:
+            The first target (in list order) found on screen, or None on timeout.
+        """
+        needles = [
+            (target if case_sensitive else target.lower(), target)
+            for target in targets
+        ]
+        deadline = time.monotonic() + timeout
+        delay = _POLL_MIN_DELAY
+        while True:
+            screen = self.screen if case_sensitive else self.screen.lower()
+            for needle, target in needles:
+                if needle in screen:
+                    return target
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            time.sleep(min(delay, remaining))
+            if delay < _POLL_LINEAR_LIMIT:
+                delay += _POLL_LINEAR_STEP
+            else:
+                delay = min(delay * 2, _POLL_MAX_DELAY)
 
     def wait_for_keyboard(self, timeout: float = 30.0) -> bool:
         """
@@ -27,6 +27,7 @@ import structlog
 from ...ast import LoginAST
 from ...ast.base import AST
 from ...core import ErrorCodes, TerminalError, TN3270Config
+from ...db import get_dynamodb_client
 from ...models import (
     ASTControlMessage,
     ASTRunMessage,
@@ -38,7 +39,6 @@ from ...models import (
     create_ast_paused_message,
     create_ast_progress_message,
     create_ast_status_message,
-    create_data_message,
     create_error_message,
     create_session_created_message,
     create_session_destroyed_message,
@@ -56,8 +56,27 @@ from tnz import tnz as tnz_module
 
 log = structlog.get_logger()
 
-# Thread pool for running blocking tnz operations
-_executor = concurrent.futures.ThreadPoolExecutor(max_workers=10, thread_name_prefix="tnz")
+# Least threads in a manager's pool for blocking tnz operations
+_EXECUTOR_MIN_WORKERS = 10
+
+
+def _parse_concurrency(value: Any) -> int:
+    """Validate the ``concurrency`` AST parameter: sessions to spread items over.
+
+    Accepts an integer (or integer string) of at least 1; missing means 1.
+
+    Raises:
+        ValueError: If the value is anything else
+    """
+    if value is None:
+        return 1
+    if isinstance(value, str) and value.strip().isdecimal():
+        value = int(value)
+    if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+        raise ValueError(
+            f"Invalid concurrency {value!r}: expected an integer of at least 1"
+        )
+    return value
 
 
 # 3270 key mappings from xterm.js input
@@ -141,7 +160,16 @@ class TN3270Manager:
         self._config = config
         self._valkey = valkey
         self._sessions: dict[str, TN3270Session] = {}
+        # Extra AST connections held against max_sessions (see _open_extra_tnz)
+        self._reserved_extras = 0
+        self._capacity_lock = threading.Lock()
         self._renderer = TN3270Renderer()
+        # Blocking tnz operations run here; sized once so every session can
+        # hold a thread for its screen polls and one for a running AST
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(_EXECUTOR_MIN_WORKERS, 2 * config.max_sessions),
+            thread_name_prefix="tnz",
+        )
 
     async def start(self) -> None:
         """Start the TN3270 manager."""
@@ -176,7 +204,11 @@ class TN3270Manager:
             await self._send_screen_update(existing)
             return existing
 
-        if len(self._sessions) >= self._config.max_sessions:
+        with self._capacity_lock:
+            at_capacity = (
+                len(self._sessions) + self._reserved_extras >= self._config.max_sessions
+            )
+        if at_capacity:
             raise TerminalError(ErrorCodes.SESSION_LIMIT_REACHED, "Maximum TN3270 sessions reached")
 
         host = host or self._config.host
@@ -193,7 +225,7 @@ class TN3270Manager:
             # Create and connect tnz in a thread (it has its own event loop)
             loop = asyncio.get_running_loop()
             tnz = await loop.run_in_executor(
-                _executor,
+                self._executor,
                 self._create_tnz_connection,
                 session_id,
                 host,
@@ -229,7 +261,7 @@ class TN3270Manager:
             await self._valkey.publish_tn3270_output(session_id, serialize_message(msg))
 
             # Wait for initial screen data in thread (before starting update loop)
-            await loop.run_in_executor(_executor, lambda: tnz.wait(timeout=2))
+            await loop.run_in_executor(self._executor, lambda: tnz.wait(timeout=2))
 
             # Send initial screen with field data
             await self._send_screen_update(session)
@@ -309,7 +341,7 @@ class TN3270Manager:
         # Close tnz connection in thread
         loop = asyncio.get_running_loop()
         try:
-            await loop.run_in_executor(_executor, session.tnz.close)
+            await loop.run_in_executor(self._executor, session.tnz.close)
         except Exception:
             pass
 
@@ -320,10 +352,20 @@ class TN3270Manager:
         await self._valkey.publish_tn3270_output(session_id, serialize_message(msg))
 
     async def destroy_all_sessions(self) -> None:
-        """Destroy all TN3270 sessions."""
+        """Destroy all TN3270 sessions concurrently."""
         session_ids = list(self._sessions.keys())
-        for session_id in session_ids:
-            await self.destroy_session(session_id, "shutdown")
+        # Overlap the per-session Valkey round-trips and socket closes
+        results = await asyncio.gather(
+            *(self.destroy_session(session_id, "shutdown") for session_id in session_ids),
+            return_exceptions=True,
+        )
+        for session_id, result in zip(session_ids, results, strict=True):
+            if isinstance(result, Exception):
+                log.warning(
+                    "Failed to destroy TN3270 session",
+                    session_id=session_id,
+                    error=str(result),
+                )
 
     async def _update_loop(self, session: TN3270Session) -> None:
         """Poll for screen updates and send them to the client."""
@@ -334,7 +376,7 @@ class TN3270Manager:
         while not session._stop_event.is_set():
             try:
                 # Wait for data with timeout in thread pool
-                await loop.run_in_executor(_executor, lambda: tnz.wait(timeout=0.1))
+                await loop.run_in_executor(self._executor, lambda: tnz.wait(timeout=0.1))
 
                 # Check if session lost
                 if tnz.seslost:
@@ -525,11 +567,11 @@ class TN3270Manager:
                     await self._send_screen_update(session)
 
                 # Update execution status in DynamoDB
-                from ...db import get_dynamodb_client
-
+                # boto3 blocks, so keep it off the event loop
                 db = get_dynamodb_client()
                 new_status = "paused" if paused else "running"
-                db.update_execution(
+                await asyncio.to_thread(
+                    db.update_execution,
                     session_id=session.session_id,
                     execution_id=execution_id,
                     updates={"status": new_status},
@@ -562,12 +604,24 @@ class TN3270Manager:
                 on_pause_state=on_pause_state,
             )
 
+            # Extra connections let the AST spread items across sessions
+            params = dict(params or {})
+            concurrency = _parse_concurrency(params.pop("concurrency", None))
+            extra_tnz = await self._open_extra_tnz(session, concurrency - 1)
+            if extra_tnz:
+                params["hosts"] = [host, *(Host(tnz) for tnz in extra_tnz)]
+
             # Run the AST in executor (blocking operations)
             # Pass execution_id so it matches what we store in DynamoDB
-            result = await loop.run_in_executor(
-                _executor,
-                lambda: ast.run(host, execution_id=execution_id, **(params or {})),
-            )
+            try:
+                result = await ast.run_async(
+                    host,
+                    execution_id=execution_id,
+                    executor=self._executor,
+                    **params,
+                )
+            finally:
+                await self._close_extra_tnz(extra_tnz)
 
             # Clear the running AST
             session.running_ast = None
@@ -576,7 +630,7 @@ class TN3270Manager:
             status_msg = create_ast_status_message(
                 session.session_id,
                 ast_name,
-                result.status.value,
+                result.status,
                 message=result.message,
                 error=result.error,
                 duration=result.duration,
@@ -592,7 +646,7 @@ class TN3270Manager:
             log.info(
                 "AST completed",
                 ast_name=ast_name,
-                status=result.status.value,
+                status=result.status,
                 duration=result.duration,
                 session_id=session.session_id,
             )
@@ -612,6 +666,71 @@ class TN3270Manager:
                 session.session_id, serialize_message(status_msg)
             )
 
+    async def _open_extra_tnz(
+        self, session: TN3270Session, count: int
+    ) -> list[tnz_module.Tnz]:
+        """Open up to ``count`` extra connections to the session's host.
+
+        They are not registered as sessions (no UI stream), but are reserved
+        against ``max_sessions`` together with the extras of other runs until
+        :meth:`_close_extra_tnz` releases them. Failed connects are skipped.
+        """
+        with self._capacity_lock:
+            count = min(
+                count,
+                self._config.max_sessions - len(self._sessions) - self._reserved_extras,
+            )
+            if count <= 0:
+                return []
+            self._reserved_extras += count
+
+        def connect(n: int) -> tnz_module.Tnz:
+            tnz = self._create_tnz_connection(
+                f"{session.session_id}-ast{n}", session.host, session.port
+            )
+            try:
+                tnz.wait(timeout=2)
+            except BaseException:
+                tnz.close()
+                raise
+            return tnz
+
+        loop = asyncio.get_running_loop()
+        opened = await asyncio.gather(
+            *(loop.run_in_executor(self._executor, connect, n) for n in range(1, count + 1)),
+            return_exceptions=True,
+        )
+        extra: list[tnz_module.Tnz] = []
+        for result in opened:
+            if isinstance(result, BaseException):
+                log.warning(
+                    "Failed to open extra AST connection",
+                    session_id=session.session_id,
+                    error=str(result),
+                )
+            else:
+                extra.append(result)
+        self._release_extras(count - len(extra))
+        return extra
+
+    async def _close_extra_tnz(self, extra: list[tnz_module.Tnz]) -> None:
+        """Close connections opened by :meth:`_open_extra_tnz`."""
+        if not extra:
+            return
+        loop = asyncio.get_running_loop()
+        try:
+            await asyncio.gather(
+                *(loop.run_in_executor(self._executor, tnz.close) for tnz in extra),
+                return_exceptions=True,
+            )
+        finally:
+            self._release_extras(len(extra))
+
+    def _release_extras(self, count: int) -> None:
+        """Return reserved extra connections to the session capacity."""
+        with self._capacity_lock:
+            self._reserved_extras -= count
+
     async def _process_input(self, session: TN3270Session, data: str) -> None:
         """Process keyboard input and send to 3270 host."""
         tnz = session.tnz
@@ -624,7 +743,7 @@ class TN3270Manager:
                     method = getattr(tnz, action, None)
                     if method:
                         log.debug("3270 key", action=action, session_id=session.session_id)
-                        await loop.run_in_executor(_executor, method)
+                        await loop.run_in_executor(self._executor, method)
                         # Send updated screen after key
                         await self._send_screen_update(session)
                     return
@@ -636,7 +755,7 @@ class TN3270Manager:
                     data=repr(data),
                     session_id=session.session_id,
                 )
-                await loop.run_in_executor(_executor, lambda: tnz.key_data(data))
+                await loop.run_in_executor(self._executor, lambda: tnz.key_data(data))
                 await self._send_screen_update(session)
 
         except Exception as e:
@@ -4,6 +4,9 @@ from __future__ import annotations
 
 import asyncio
 import gc
+import os
+import selectors
+import signal
 from types import SimpleNamespace
 import unittest
 from unittest.mock import AsyncMock, patch
@@ -11,6 +14,32 @@ from unittest.mock import AsyncMock, patch
 import src.app as app_module
 
 
+class _FakeRunner:
+    """Stand-in for asyncio.Runner that records how it was used."""
+
+    instances: list["_FakeRunner"] = []
+
+    def __init__(self, **kwargs) -> None:
+        self.kwargs = kwargs
+        self.loop = SimpleNamespace(slow_callback_duration=0.1)
+        self.ran: list[str] = []
+        type(self).instances.append(self)
+
+    def __enter__(self) -> "_FakeRunner":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+    def get_loop(self):
+        return self.loop
+
+    def run(self, coro):
+        # Close the coroutine to avoid "never awaited" warnings
+        self.ran.append(coro.__name__)
+        coro.close()
+
+
 class AppAsyncTests(unittest.IsolatedAsyncioTestCase):
     def tearDown(self) -> None:
         """Clean up any remaining coroutines after each test."""
@@ -25,8 +54,7 @@ class AppAsyncTests(unittest.IsolatedAsyncioTestCase):
             dynamodb=SimpleNamespace(),
         )
         fake_valkey = SimpleNamespace(start_listening=AsyncMock())
-        fake_manager = SimpleNamespace(start=AsyncMock())
-        fake_loop = SimpleNamespace(add_signal_handler=lambda *args, **kwargs: None)
+        fake_manager = SimpleNamespace(start=AsyncMock(), destroy_all_sessions=AsyncMock())
 
         with patch.object(app_module, "get_config", return_value=config), patch(
             "src.db.get_dynamodb_client"
@@ -34,13 +62,14 @@ class AppAsyncTests(unittest.IsolatedAsyncioTestCase):
             app_module, "init_valkey_client", new=AsyncMock(return_value=fake_valkey)
         ) as mock_valkey, patch.object(
             app_module, "init_tn3270_manager", return_value=fake_manager
-        ) as mock_manager, patch(
-            "asyncio.get_running_loop", return_value=fake_loop
-        ):
+        ) as mock_manager, patch.object(
+            app_module, "close_valkey_client", new=AsyncMock()
+        ) as mock_close:
             task = asyncio.create_task(app_module.async_main())
-            await asyncio.sleep(0)
-            assert app_module._shutdown_event is not None
-            app_module._shutdown_event.set()
+            while not fake_valkey.start_listening.await_count:
+                await asyncio.sleep(0)
+            assert app_module._shutdown_future is not None
+            app_module._shutdown_future.set_result(None)
             await task
 
         mock_db.assert_called_once_with(config.dynamodb)
@@ -48,66 +77,208 @@ class AppAsyncTests(unittest.IsolatedAsyncioTestCase):
         mock_manager.assert_called_once_with(config.tn3270, fake_valkey)
         fake_manager.start.assert_awaited_once()
         fake_valkey.start_listening.assert_awaited_once()
-        app_module._shutdown_event = None
+        # Shutdown runs on the same loop once the wait returns
+        fake_manager.destroy_all_sessions.assert_awaited_once()
+        mock_close.assert_awaited_once()
+        app_module._shutdown_future = None
+
+    async def test_async_main_shuts_down_after_startup_failure(self) -> None:
+        config = SimpleNamespace(
+            valkey=SimpleNamespace(host="valkey", port=6379),
+            tn3270=SimpleNamespace(host="host", port=23, max_sessions=2),
+            dynamodb=SimpleNamespace(),
+        )
+        with patch.object(app_module, "get_config", return_value=config), patch(
+            "src.db.get_dynamodb_client"
+        ), patch.object(
+            app_module, "init_valkey_client", new=AsyncMock(side_effect=ConnectionError("down"))
+        ), patch.object(
+            app_module, "close_valkey_client", new=AsyncMock()
+        ) as mock_close, self.assertRaises(ConnectionError):
+            await app_module.async_main()
+
+        mock_close.assert_not_awaited()
+        assert app_module._shutdown_future is not None
+        self.assertTrue(app_module._shutdown_future.done())
+        app_module._shutdown_future = None
+
+    async def test_async_main_settles_tn3270_startup_before_shutdown(self) -> None:
+        config = SimpleNamespace(
+            valkey=SimpleNamespace(host="valkey", port=6379),
+            tn3270=SimpleNamespace(host="host", port=23, max_sessions=2),
+            dynamodb=SimpleNamespace(),
+        )
+        events: list[str] = []
+
+        async def slow_valkey(*args, **kwargs):
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                events.append("valkey cancelled")
+                raise
+
+        async def fake_shutdown(state, sig=None):
+            events.append("shutdown")
+
+        with patch.object(app_module, "get_config", return_value=config), patch(
+            "src.db.get_dynamodb_client", side_effect=RuntimeError("no table")
+        ), patch.object(app_module, "init_valkey_client", new=slow_valkey), patch.object(
+            app_module, "shutdown", new=fake_shutdown
+        ), self.assertRaises(RuntimeError):
+            await app_module.async_main()
+
+        self.assertEqual(events, ["valkey cancelled", "shutdown"])
+        app_module._shutdown_future = None
 
     async def test_shutdown_handles_manager_and_valkey(self) -> None:
         fake_manager = SimpleNamespace(destroy_all_sessions=AsyncMock())
-        with patch("src.app.get_tn3270_manager", return_value=fake_manager, autospec=False), patch(
-            "src.app.close_valkey_client", new=AsyncMock(), autospec=False
-        ) as mock_close:
-            app_module._shutdown_event = asyncio.Event()
-            await app_module.shutdown()
+        state = app_module.GatewayState(tn3270_manager=fake_manager, valkey_started=True)
+        with patch("src.app.close_valkey_client", new=AsyncMock()) as mock_close:
+            app_module._shutdown_future = asyncio.get_running_loop().create_future()
+            await app_module.shutdown(state)
 
         fake_manager.destroy_all_sessions.assert_awaited_once()
         mock_close.assert_awaited_once()
-        assert app_module._shutdown_event is not None
-        self.assertTrue(app_module._shutdown_event.is_set())
-        app_module._shutdown_event = None
+        assert app_module._shutdown_future is not None
+        self.assertTrue(app_module._shutdown_future.done())
+        self.assertIsNone(state.tn3270_manager)
+        self.assertFalse(state.valkey_started)
+        app_module._shutdown_future = None
+
+    async def test_shutdown_skips_components_that_never_started(self) -> None:
+        with patch("src.app.close_valkey_client", new=AsyncMock()) as mock_close:
+            await app_module.shutdown(app_module.GatewayState())
+
+        mock_close.assert_not_awaited()
+
+    def test_add_timestamp_uses_epoch_nanoseconds(self) -> None:
+        with patch("src.app.time.time_ns", return_value=123):
+            event = app_module._add_timestamp(None, "info", {"event": "x"})
+
+        self.assertEqual(event, {"event": "x", "ts": 123})
 
     def test_main_runs_async_main(self) -> None:
-        def fake_run(coro):
-            # Properly close the coroutine to avoid "never awaited" warning
-            coro.close()
+        with patch("asyncio.Runner", new=_FakeRunner):
+            app_module.main()
+
+        runner = _FakeRunner.instances[-1]
+        self.assertEqual(runner.ran, ["async_main"])
+        self.assertFalse(runner.kwargs["debug"])
+
+    def test_main_uses_uvloop_factory_when_available(self) -> None:
+        fake_uvloop = SimpleNamespace(new_event_loop=lambda: None)
+
+        with patch.object(app_module, "uvloop", fake_uvloop), patch(
+            "asyncio.Runner", new=_FakeRunner
+        ):
+            app_module.main()
+
+        runner = _FakeRunner.instances[-1]
+        self.assertIs(runner.kwargs["loop_factory"], fake_uvloop.new_event_loop)
 
-        with patch("asyncio.run", side_effect=fake_run) as mock_run:
+    def test_main_falls_back_to_epoll_selector_loop_on_linux(self) -> None:
+        with patch.object(app_module, "uvloop", None), patch.object(
+            app_module.sys, "platform", "linux"
+        ), patch("asyncio.Runner", new=_FakeRunner):
             app_module.main()
 
-        mock_run.assert_called_once()
+        loop_factory = _FakeRunner.instances[-1].kwargs["loop_factory"]
+        if not hasattr(selectors, "EpollSelector"):  # pragma: no cover - non-Linux hosts
+            return
+        loop = loop_factory()
+        try:
+            self.assertIsInstance(loop, asyncio.SelectorEventLoop)
+            self.assertIsInstance(loop._selector, selectors.EpollSelector)
+        finally:
+            loop.close()
 
-    def test_main_handles_keyboard_interrupt(self) -> None:
-        shutdown_called = False
-        main_called = False
+    def test_main_falls_back_to_default_loop_elsewhere(self) -> None:
+        with patch.object(app_module, "uvloop", None), patch.object(
+            app_module.sys, "platform", "darwin"
+        ), patch("asyncio.Runner", new=_FakeRunner):
+            app_module.main()
 
-        async def fake_async_main():
-            nonlocal main_called
-            main_called = True
-            # Simulate the function running but being interrupted
+        self.assertIsNone(_FakeRunner.instances[-1].kwargs["loop_factory"])
 
-        async def fake_shutdown():
+    def test_main_enables_debug_only_when_requested(self) -> None:
+        with patch.dict(os.environ, {"GATEWAY_ASYNCIO_DEBUG": "1"}), patch(
+            "asyncio.Runner", new=_FakeRunner
+        ):
+            app_module.main()
+
+        runner = _FakeRunner.instances[-1]
+        self.assertTrue(runner.kwargs["debug"])
+        self.assertEqual(runner.loop.slow_callback_duration, 0.05)
+
+    def test_main_swallows_keyboard_interrupt_without_rerunning_shutdown(self) -> None:
+        shutdown_called = False
+
+        async def fake_shutdown(state, sig=None):
             nonlocal shutdown_called
             shutdown_called = True
 
-        original_run = asyncio.run
+        class _InterruptedRunner(_FakeRunner):
+            instances: list[_FakeRunner] = []
 
-        def fake_run(coro):
-            if not hasattr(fake_run, "times"):
-                fake_run.times = 0  # type: ignore[attr-defined]
-            fake_run.times += 1  # type: ignore[attr-defined]
-            if fake_run.times == 1:
-                # First call: run the coroutine then raise KeyboardInterrupt
-                result = original_run(coro)
+            def run(self, coro):
+                super().run(coro)
                 raise KeyboardInterrupt
-            # Second call: run shutdown normally
-            return original_run(coro)
 
-        with patch.object(app_module, "async_main", new=fake_async_main), patch.object(
+        with patch.object(app_module, "shutdown", new=fake_shutdown), patch(
+            "asyncio.Runner", new=_InterruptedRunner
+        ):
+            app_module.main()  # exits quietly, no traceback
+
+        self.assertEqual(len(_InterruptedRunner.instances), 1)
+        self.assertFalse(shutdown_called)
+
+    async def test_signal_handler_schedules_shutdown_once(self) -> None:
+        config = SimpleNamespace(
+            valkey=SimpleNamespace(host="valkey", port=6379),
+            tn3270=SimpleNamespace(host="host", port=23, max_sessions=2),
+            dynamodb=SimpleNamespace(),
+        )
+        fake_valkey = SimpleNamespace(start_listening=AsyncMock())
+        fake_manager = SimpleNamespace(start=AsyncMock())
+        shutdown_calls: list = []
+
+        async def fake_shutdown(state, sig=None):
+            shutdown_calls.append(sig)
+
+        previous_handler = signal.getsignal(signal.SIGTERM)
+        with patch.object(app_module, "get_config", return_value=config), patch(
+            "src.db.get_dynamodb_client"
+        ), patch.object(
+            app_module, "init_valkey_client", new=AsyncMock(return_value=fake_valkey)
+        ), patch.object(
+            app_module, "init_tn3270_manager", return_value=fake_manager
+        ), patch.object(
             app_module, "shutdown", new=fake_shutdown
-        ), patch("asyncio.run", side_effect=fake_run) as mock_run:
-            app_module.main()
+        ):
+            task = asyncio.create_task(app_module.async_main())
+            while signal.getsignal(signal.SIGTERM) is previous_handler:
+                await asyncio.sleep(0)
+            os.kill(os.getpid(), signal.SIGTERM)
+            os.kill(os.getpid(), signal.SIGTERM)
+            await asyncio.wait_for(task, timeout=1)
+
+        self.assertEqual(shutdown_calls, [signal.SIGTERM])
+        self.assertIs(signal.getsignal(signal.SIGTERM), previous_handler)
+
+    def test_signal_wakeup_ignores_noise_signals_until_restored(self) -> None:
+        loop = SimpleNamespace(add_reader=lambda *args: None, remove_reader=lambda *args: None)
+        previous = {sig: signal.getsignal(sig) for sig in app_module._IGNORED_SIGNALS}
+
+        restore = app_module._install_signal_wakeup(loop, lambda sig: None)
+        try:
+            for sig in app_module._IGNORED_SIGNALS:
+                self.assertIs(signal.getsignal(sig), signal.SIG_IGN)
+        finally:
+            restore()
 
-        self.assertEqual(mock_run.call_count, 2)
-        self.assertTrue(main_called)
-        self.assertTrue(shutdown_called)
+        for sig, handler in previous.items():
+            self.assertIs(signal.getsignal(sig), handler)
+        app_module._shutdown_future = None
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -2,13 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import threading
 import time
 import unittest
+from unittest.mock import MagicMock, patch
 
 from datetime import datetime, timedelta
 
-from src.ast.base import AST, ASTResult, ASTStatus, ItemResult
+from src.ast.base import (
+    AST,
+    ASTResult,
+    ASTStatus,
+    ItemResult,
+    ItemResultAccumulator,
+    _max_parallel_workers,
+)
 
 
 class DummyHost:
@@ -60,6 +70,8 @@ class ASTBaseTests(unittest.TestCase):
 
     def test_pause_resume_and_callbacks(self) -> None:
         self.assertFalse(self.ast.is_paused)
+        self.assertIsNone(self.ast._pause_event)
+        self.assertTrue(self.ast.wait_if_paused())
         self.ast.pause()
         self.assertTrue(self.ast.is_paused)
         self.assertTrue(any(call[0] is True for call in self.pause_calls))
@@ -87,6 +99,41 @@ class ASTBaseTests(unittest.TestCase):
         self.assertTrue(self.progress_calls)
         self.assertTrue(self.item_calls)
 
+    def test_reports_skip_debug_logging_when_disabled(self) -> None:
+        self.ast._debug_enabled = False
+        with patch("src.ast.base.log") as mock_log:
+            self.ast.report_progress(1, 2, "item", "running", "msg")
+            self.ast.report_item_result("item", "success", duration_ms=5)
+        mock_log.debug.assert_not_called()
+        self.assertEqual(len(self.progress_calls), 1)
+        self.assertEqual(len(self.item_calls), 1)
+
+    def test_run_async_runs_off_the_event_loop(self) -> None:
+        loop_thread = threading.get_ident()
+        run_threads: list[int] = []
+        original_run = self.ast.run
+
+        def tracking_run(*args, **kwargs):
+            run_threads.append(threading.get_ident())
+            return original_run(*args, **kwargs)
+
+        self.ast.run = tracking_run
+        result = asyncio.run(self.ast.run_async(self.host, "exec-2", foo="bar"))
+
+        self.assertTrue(result.is_success)
+        self.assertEqual(self.ast.executed_with, {"foo": "bar"})
+        self.assertNotEqual(run_threads, [loop_thread])
+
+    def test_run_only_generates_an_id_when_none_is_given(self) -> None:
+        with patch("src.ast.base.uuid4") as mock_uuid:
+            self.ast.run(self.host, execution_id="exec-given")
+        mock_uuid.assert_not_called()
+
+        with patch("src.ast.base.uuid4", return_value="generated") as mock_uuid:
+            self.ast.run(self.host)
+        mock_uuid.assert_called_once()
+        self.assertEqual(self.ast.execution_id, "generated")
+
     def test_run_handles_timeout(self) -> None:
         result = self.ast.run(self.host, raise_timeout=True)
         self.assertEqual(result.status, ASTStatus.TIMEOUT)
@@ -119,6 +166,85 @@ class ASTBaseTests(unittest.TestCase):
         self.assertAlmostEqual(result.duration, 2, delta=0.1)
         self.assertTrue(result.is_success)
         self.assertEqual(result.item_results[0].data["k"], "v")
+        self.assertFalse(hasattr(result, "__dict__"))
+        self.assertFalse(hasattr(result.item_results[0], "__dict__"))
+
+    def test_ast_status_members_are_strings(self) -> None:
+        self.assertEqual(ASTStatus.CANCELLED, "cancelled")
+        self.assertEqual(json.dumps({"status": ASTStatus.SUCCESS}), '{"status": "success"}')
+
+
+    def test_item_result_accumulator_counts_statuses(self) -> None:
+        now = datetime.now()
+        acc = ItemResultAccumulator()
+        for status in ("success", "failed", "success", "skipped"):
+            acc.add(ItemResult("id", status, now, now, 0))
+        self.assertEqual((acc.success, acc.failed, acc.skipped), (2, 1, 1))
+        self.assertEqual([r.status for r in acc.results], ["success", "failed", "success", "skipped"])
+
+        presized = ItemResultAccumulator([None] * 3)
+        presized.add(ItemResult("c", "success", now, now, 0), 2)
+        presized.add(ItemResult("a", "failed", now, now, 0), 0)
+        self.assertEqual([r.item_id for r in presized.recorded()], ["a", "c"])
+        self.assertEqual((presized.success, presized.failed), (1, 1))
+
+    def test_running_progress_is_throttled(self) -> None:
+        with patch("src.ast.base.time.monotonic", side_effect=[100.0, 100.05, 100.2]):
+            self.ast._maybe_report_progress(1, 3, "a", "running", "Logging in")
+            self.ast._maybe_report_progress(1, 3, "a", "running", "Processing")
+            self.ast._maybe_report_progress(1, 3, "a", "success", "Completed")
+            self.ast._maybe_report_progress(2, 3, "b", "running", "Processing")
+        self.assertEqual(
+            [call[4] for call in self.progress_calls],
+            ["Logging in", "Completed", "Processing"],
+        )
+
+    def test_running_progress_throttle_holds_across_workers(self) -> None:
+        start = threading.Barrier(8)
+
+        def worker() -> None:
+            start.wait()
+            self.ast._maybe_report_progress(1, 3, "a", "running", "Processing")
+
+        with patch("src.ast.base.time.monotonic", return_value=100.0):
+            threads = [threading.Thread(target=worker) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(len(self.progress_calls), 1)
+
+    def test_max_parallel_workers_ignores_non_integer_values(self) -> None:
+        with patch.dict("os.environ", {}, clear=True):
+            default = _max_parallel_workers()
+        for raw in ("", "auto", "1.5"):
+            with patch.dict("os.environ", {"AST_MAX_WORKERS": raw}):
+                self.assertEqual(_max_parallel_workers(), default)
+        with patch.dict("os.environ", {"AST_MAX_WORKERS": "0"}):
+            self.assertEqual(_max_parallel_workers(), 1)
+
+    def test_record_item_result_reports_live_counts(self) -> None:
+        now = datetime.now()
+        acc = ItemResultAccumulator([None] * 2)
+        with patch.object(self.ast, "_save_item_result"):
+            self.ast._record_item_result("a", "success", now, now, 1, acc, 1, 2)
+            self.ast._record_item_result("b", "failed", now, now, 1, acc, 2, 2, error="x")
+        messages = [call[4] for call in self.progress_calls]
+        self.assertEqual(messages[0], "Item 1/2: Completed (1 success, 0 failed, 0 skipped)")
+        self.assertEqual(messages[1], "Item 2/2: Failed - x (1 success, 1 failed, 0 skipped)")
+
+    def test_empty_item_data_and_error_are_not_persisted(self) -> None:
+        now = datetime.now()
+        self.ast._db = MagicMock()
+        self.ast._save_item_result("a", "success", 1, now, now, error=None, item_data={})
+        self.ast._save_item_result("b", "failed", 1, now, now, error="x", item_data={"k": "v"})
+        self.ast._drain_io()
+        written = self.ast._db.batch_put_policy_results.call_args.kwargs["results"]
+        (_, empty), (_, full) = written
+        self.assertNotIn("policy_data", empty)
+        self.assertNotIn("error", empty)
+        self.assertEqual(full["policy_data"], {"k": "v"})
+        self.assertEqual(full["error"], "x")
 
 
 if __name__ == "__main__":  # pragma: no cover
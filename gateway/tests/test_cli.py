@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import os
 import unittest
 from unittest.mock import MagicMock, patch
 
 from src import cli
 
 
+@patch.dict(os.environ, {"CI": ""})
 class CliTests(unittest.TestCase):
     """Ensure CLI helpers orchestrate pytest execution correctly."""
 
@@ -35,6 +37,16 @@ class CliTests(unittest.TestCase):
         ])
         sys_exit.assert_called_once_with(0)
 
+    def test_ci_runs_disable_the_pytest_cache(self) -> None:
+        with patch.dict(os.environ, {"CI": "true"}), patch(
+            "src.cli.pytest.main", return_value=0
+        ) as pytest_main, patch("src.cli.sys.exit"):
+            cli.run_tests()
+
+        pytest_main.assert_called_once_with(
+            [str(cli.TESTS_DIR), "-v", "-p", "no:cacheprovider"]
+        )
+
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
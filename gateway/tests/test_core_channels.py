@@ -25,6 +25,14 @@ class ChannelHelperTests(unittest.TestCase):
             channels.get_tn3270_output_channel("sess-99"), "tn3270.output.sess-99"
         )
 
+    def test_channel_names_are_cached_per_session(self) -> None:
+        first = channels.get_tn3270_output_channel("sess-cached")
+        self.assertIs(channels.get_tn3270_output_channel("sess-cached"), first)
+        self.assertIs(
+            channels.get_tn3270_input_channel("sess-cached"),
+            channels.get_tn3270_input_channel("sess-cached"),
+        )
+
     def test_control_channel_constant(self) -> None:
         self.assertEqual(channels.TN3270_CONTROL_CHANNEL, "tn3270.control")
 
@@ -14,7 +14,7 @@ class ConfigTests(unittest.TestCase):
     """Exercise environment-driven configuration helpers."""
 
     def tearDown(self) -> None:  # pragma: no cover - helper
-        config_module._config = None
+        config_module.get_config.cache_clear()
 
     @patch.dict(
         os.environ,
@@ -40,7 +40,7 @@ class ConfigTests(unittest.TestCase):
     )
     def test_get_config_reads_environment(self) -> None:
         importlib.reload(config_module)
-        config_module._config = None
+        config_module.get_config.cache_clear()
 
         cfg = config_module.get_config()
 
@@ -65,7 +65,7 @@ class ConfigTests(unittest.TestCase):
 
     def test_get_config_returns_cached_instance(self) -> None:
         importlib.reload(config_module)
-        config_module._config = None
+        config_module.get_config.cache_clear()
         with patch.dict(
             os.environ,
             {
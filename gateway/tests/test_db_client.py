@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import threading
+import time
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -29,7 +31,7 @@ class DynamoDBClientTests(unittest.TestCase):
         self.mock_client_ctor = client_patcher.start()
         self.mock_table = MagicMock()
         self.mock_resource.return_value.Table.return_value = self.mock_table
-        self.mock_low_level = self.mock_client_ctor.return_value
+        self.mock_low_level = self.mock_resource.return_value.meta.client
         self.mock_low_level.describe_table.return_value = {"Table": {}}
         client_module._client = None
 
@@ -43,6 +45,13 @@ class DynamoDBClientTests(unittest.TestCase):
             self.config.table_name
         )
 
+    def test_low_level_client_comes_from_pooled_adaptive_retry_resource(self) -> None:
+        DynamoDBClient(self.config)
+        self.mock_client_ctor.assert_not_called()
+        boto_config = self.mock_resource.call_args.kwargs["config"]
+        self.assertEqual(boto_config.max_pool_connections, 50)
+        self.assertEqual(boto_config.retries, {"max_attempts": 10, "mode": "adaptive"})
+
     def test_constructor_raises_when_validation_fails(self) -> None:
         self.mock_low_level.describe_table.side_effect = Exception("boom")
         with self.assertRaises(RuntimeError):
@@ -60,6 +69,14 @@ class DynamoDBClientTests(unittest.TestCase):
         self.assertEqual(result, {"status": "running"})
         kwargs = self.mock_table.update_item.call_args.kwargs
         self.assertEqual(kwargs["Key"], {"PK": "USER#123", "SK": "SESSION#abc"})
+        self.assertEqual(kwargs["UpdateExpression"], "SET #attr0 = :val0, #attr1 = :val1")
+        self.assertEqual(kwargs["ExpressionAttributeNames"], {"#attr0": "status", "#attr1": "progress"})
+        self.assertEqual(kwargs["ExpressionAttributeValues"], {":val0": "running", ":val1": 50})
+
+        client.update_item(pk="USER#123", sk="SESSION#abc", updates={"status": "done", "progress": 99})
+        again = self.mock_table.update_item.call_args.kwargs
+        self.assertIs(again["ExpressionAttributeNames"], kwargs["ExpressionAttributeNames"])
+        self.assertEqual(again["ExpressionAttributeValues"], {":val0": "done", ":val1": 99})
 
     def test_query_helpers_delegate_to_table(self) -> None:
         client = DynamoDBClient(self.config)
@@ -87,11 +104,79 @@ class DynamoDBClientTests(unittest.TestCase):
         client.get_user_executions_by_date("u1", "2024-01-01", status="running")
         self.assertTrue(self.mock_table.put_item.called)
 
-    def test_get_execution_by_id_scans_table(self) -> None:
+    def test_batch_put_policy_results_writes_marshalled_items(self) -> None:
+        client = DynamoDBClient(self.config)
+        batch_write = self.mock_low_level.batch_write_item
+        batch_write.return_value = {"UnprocessedItems": {}}
+        results = [(f"policy{n}", {"status": "success", "duration_ms": n}) for n in range(30)]
+        results.append(("policy0", {"status": "failed", "duration_ms": 7, "policy_data": {"k": "v"}}))
+        client.batch_put_policy_results("exec1", results)
+
+        batches = [c.kwargs["RequestItems"]["terminal"] for c in batch_write.call_args_list]
+        self.assertEqual([len(b) for b in batches], [25, 5])
+        items = [r["PutRequest"]["Item"] for b in batches for r in b]
+        # Duplicate keys collapse to the last write
+        self.assertEqual(
+            items[0],
+            {
+                "PK": {"S": "EXECUTION#exec1"},
+                "SK": {"S": "POLICY#policy0"},
+                "execution_id": {"S": "exec1"},
+                "policy_number": {"S": "policy0"},
+                "status": {"S": "failed"},
+                "duration_ms": {"N": "7"},
+                "policy_data": {"M": {"k": {"S": "v"}}},
+            },
+        )
+        self.mock_resource.return_value.batch_write_item.assert_not_called()
+        self.mock_table.put_item.assert_not_called()
+
+    @patch("src.db.client.time.sleep", return_value=None)
+    def test_batch_write_retries_unprocessed_items_with_backoff(self, mock_sleep) -> None:
+        client = DynamoDBClient(self.config)
+        batch_write = self.mock_resource.return_value.batch_write_item
+        leftover = {"terminal": [{"PutRequest": {"Item": {"PK": "p", "SK": "s"}}}]}
+        batch_write.side_effect = [
+            {"UnprocessedItems": leftover},
+            {"UnprocessedItems": leftover},
+            {"UnprocessedItems": {}},
+        ]
+        client.batch_put_items([{"PK": "p", "SK": "s"}, {"PK": "p", "SK": "t"}])
+
+        self.assertEqual(batch_write.call_count, 3)
+        self.assertEqual(batch_write.call_args.kwargs["RequestItems"], leftover)
+        self.assertEqual([c.args[0] for c in mock_sleep.call_args_list], [0.05, 0.1])
+
+        batch_write.side_effect = None
+        batch_write.return_value = {"UnprocessedItems": leftover}
+        with self.assertRaises(RuntimeError):
+            client.batch_put_items([{"PK": "p", "SK": "s"}])
+
+    def test_get_execution_by_id_queries_gsi3(self) -> None:
         client = DynamoDBClient(self.config)
-        self.mock_table.scan.return_value = {"Items": [{"SK": "EXECUTION#id"}]}
+        self.mock_table.query.side_effect = [
+            {"Items": [], "LastEvaluatedKey": {"PK": "EXECUTION#id"}},
+            {"Items": [{"SK": "EXECUTION#id"}]},
+        ]
         result = client.get_execution_by_id("id")
         self.assertEqual(result["SK"], "EXECUTION#id")
+        self.mock_table.scan.assert_not_called()
+        first, second = (c.kwargs for c in self.mock_table.query.call_args_list)
+        self.assertEqual(first["IndexName"], "GSI3")
+        self.assertNotIn("Limit", first)
+        self.assertEqual(second["ExclusiveStartKey"], {"PK": "EXECUTION#id"})
+
+        self.mock_table.query.side_effect = None
+        self.mock_table.query.return_value = {"Items": []}
+        self.assertIsNone(client.get_execution_by_id("missing"))
+
+    def test_get_execution_by_id_always_reads_the_table(self) -> None:
+        client = DynamoDBClient(self.config)
+        self.mock_table.query.return_value = {"Items": [{"SK": "EXECUTION#id", "status": "running"}]}
+        client.put_execution("sess", "id", {"status": "running"})
+        client.get_execution_by_id("id")
+        client.get_execution_by_id("id")
+        self.assertEqual(self.mock_table.query.call_count, 2)
 
     def test_singleton_getter(self) -> None:
         with patch.object(client_module, "DynamoDBClient", return_value="instance"):
@@ -100,6 +185,25 @@ class DynamoDBClientTests(unittest.TestCase):
         self.assertEqual(first, "instance")
         self.assertEqual(second, "instance")
 
+    def test_singleton_is_built_once_under_concurrent_first_use(self) -> None:
+        constructed: list[object] = []
+
+        def slow_ctor(config):
+            time.sleep(0.02)
+            constructed.append(config)
+            return object()
+
+        with patch.object(client_module, "DynamoDBClient", side_effect=slow_ctor):
+            threads = [
+                threading.Thread(target=get_dynamodb_client, args=(self.config,))
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(len(constructed), 1)
+
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import threading
 import unittest
 from unittest.mock import patch
 
-from src.ast.login import LoginAST
+from src.ast.login import LoginAST, validate_policy_number
 from src.ast.base import ASTStatus
 
 
@@ -19,11 +20,18 @@ class _FakeHost:
         self.enter_calls = 0
         self.pf_calls: list[int] = []
         self.typed: list[str] = []
+        self.is_connected = True
 
     def wait_for_text(self, text: str, timeout: float = 0) -> bool:
         self.wait_calls.append(text)
         return True
 
+    def wait_for_any(self, targets: list[str], timeout: float = 0) -> str | None:
+        return next((t for t in targets if self.wait_for_text(t, timeout)), None)
+
+    def screen_contains(self, text: str, case_sensitive: bool = True) -> bool:
+        return False
+
     def show_screen(self, title: str) -> str:
         self.screens.append(title)
         return f"{title}:screen"
@@ -53,13 +61,24 @@ class _FakeDB:
         self.executions: list[tuple[dict, dict]] = []
         self.policy_results: list[tuple[str, dict]] = []
         self.updates: list[dict] = []
+        self.batch_sizes: list[int] = []
+        self.batch_threads: list[str] = []
+        self.execution_threads: list[str] = []
 
     def put_execution(self, **kwargs) -> None:
         self.executions.append((kwargs.get("data", {}), kwargs))
+        self.execution_threads.append(threading.current_thread().name)
 
     def put_policy_result(self, execution_id: str, policy_number: str, data: dict) -> None:
         self.policy_results.append((policy_number, data))
 
+    def batch_put_policy_results(
+        self, execution_id: str, results: list[tuple[str, dict]]
+    ) -> None:
+        self.batch_sizes.append(len(results))
+        self.batch_threads.append(threading.current_thread().name)
+        self.policy_results.extend(results)
+
     def update_execution(self, session_id: str, execution_id: str, updates: dict) -> None:
         self.updates.append(updates)
 
@@ -98,7 +117,7 @@ class LoginASTTests(unittest.TestCase):
         self.assertEqual(len(result.item_results), 1)
         self.assertGreater(len(host.screens), 0)
         self.assertTrue(fake_db.policy_results)
-        self.assertTrue(any(u["status"] == "success" for u in fake_db.updates))
+        self.assertTrue(any(u.get("status") == "success" for u in fake_db.updates))
 
     @patch("src.ast.base.get_dynamodb_client")
     @patch("src.ast.login.time.sleep", return_value=None)
@@ -120,6 +139,474 @@ class LoginASTTests(unittest.TestCase):
 
         self.assertEqual(result.item_results[0].status, "skipped")
         self.assertEqual(fake_db.policy_results[0][0], "INVALID")
+        # Skipped items never touch the session
+        self.assertEqual(host.filled, [])
+
+    def test_validate_policy_number(self) -> None:
+        self.assertTrue(validate_policy_number("ABC123456"))
+        for value in ("", "ABC12345", "ABC1234567", "ABC-23456", "ABC12345\n", "ABC12345٣"):
+            self.assertFalse(validate_policy_number(value), value)
+
+    @patch("src.ast.base.get_dynamodb_client")
+    @patch("src.ast.login.time.sleep", return_value=None)
+    def test_run_spreads_items_across_hosts(self, _sleep: object, mock_db_factory: object) -> None:
+        hosts = [_FakeHost(), _FakeHost()]
+        fake_db = _FakeDB()
+        mock_db_factory.return_value = fake_db
+
+        ast = LoginAST()
+        policies = [f"ABC{n:06d}" for n in range(6)]
+        # The first two items can only finish if both hosts run at once
+        barrier = threading.Barrier(2, timeout=5)
+        original = ast.process_single_item
+
+        def process(host, item, index, total):
+            if index <= 2:
+                barrier.wait()
+            return original(host, item, index, total)
+
+        ast.process_single_item = process
+        result = ast.run(
+            hosts[0],
+            execution_id="exec-789",
+            username="USER1",
+            password="PASS1",
+            policyNumbers=policies,
+            hosts=hosts,
+        )
+
+        self.assertEqual(result.status, ASTStatus.SUCCESS)
+        # Results come back in item order even though hosts finish out of order
+        self.assertEqual([r.item_id for r in result.item_results], policies)
+        self.assertTrue(all(r.status == "success" for r in result.item_results))
+        self.assertEqual(result.data["successCount"], 6)
+        self.assertEqual(len(fake_db.policy_results), 6)
+        # Each worker keeps its host signed in for the whole batch
+        self.assertEqual([host.filled.count(("Userid", "USER1")) for host in hosts], [1, 1])
+
+    def test_logoff_reports_sign_off_outcome(self) -> None:
+        host = _FakeHost()
+        self.assertEqual(LoginAST().logoff(host), (True, "", ["Signed Off:screen"]))
+
+        stuck = _FakeHost()
+        stuck.wait_for_text = lambda text, timeout=0: text == "Exit Menu"
+        self.assertEqual(
+            LoginAST().logoff(stuck),
+            (False, "Failed to sign off", ["Sign Off Failed:screen"]),
+        )
+
+    def test_sign_off_backs_off_exponentially(self) -> None:
+        host = _FakeHost()
+        waits: list[float] = []
+
+        def wait_for_text(text: str, timeout: float = 0) -> bool:
+            if text != "Exit Menu":
+                return True
+            waits.append(timeout)
+            return len(waits) > 5
+
+        host.wait_for_text = wait_for_text
+        self.assertTrue(LoginAST().sign_off(host))
+        self.assertEqual(waits, [0.1, 0.2, 0.4, 0.8, 1.0, 1.0])
+        self.assertEqual(host.pf_calls, [15] * 5)
+
+    @patch("src.ast.login.time.monotonic", side_effect=[0.0, 5.0, 25.0])
+    def test_sign_off_gives_up_polling_at_deadline(self, _monotonic) -> None:
+        host = _FakeHost()
+        host.wait_for_text = lambda text, timeout=0: text != "Exit Menu"
+
+        self.assertTrue(LoginAST().sign_off(host))
+        self.assertEqual(host.pf_calls, [15])
+        self.assertIn("Exit Menu", host.screens)
+
+    @patch("src.ast.login.time.sleep", return_value=None)
+    def test_simulated_delay_is_opt_in(self, mock_sleep) -> None:
+        ast = LoginAST()
+        ast.process_single_item(_FakeHost(), "ABC123456", 0, 1)
+        mock_sleep.assert_not_called()
+
+        ast.simulate_delay = 0.25
+        ast.process_single_item(_FakeHost(), "ABC123456", 0, 1)
+        mock_sleep.assert_called_once_with(0.25)
+
+    @patch("src.ast.base.get_dynamodb_client")
+    @patch("src.ast.login.time.sleep", return_value=None)
+    def test_item_ids_are_computed_once_per_item(self, _sleep: object, mock_db_factory: object) -> None:
+        mock_db_factory.return_value = _FakeDB()
+        ast = LoginAST()
+        policies = [f"ABC{n:06d}" for n in range(4)]
+
+        with patch.object(ast, "get_item_id", wraps=ast.get_item_id) as get_item_id:
+            result = ast.run(
+                _FakeHost(),
+                execution_id="exec-ids",
+                username="USER1",
+                password="PASS1",
+                policyNumbers=policies,
+                hosts=[_FakeHost(), _FakeHost()],
+            )
+
+        self.assertEqual(result.status, ASTStatus.SUCCESS)
+        self.assertEqual(get_item_id.call_count, len(policies))
+
+    @patch("src.ast.base.get_dynamodb_client")
+    @patch("src.ast.login.time.sleep", return_value=None)
+    def test_parallel_success_screenshots_are_opt_in(self, _sleep: object, mock_db_factory: object) -> None:
+        mock_db_factory.return_value = _FakeDB()
+        kwargs = dict(
+            username="USER1",
+            password="PASS1",
+            policyNumbers=["ABC000001", "ABC000002"],
+        )
+
+        ast = LoginAST()
+        result = ast.run(_FakeHost(), hosts=[_FakeHost(), _FakeHost()], **kwargs)
+        self.assertEqual(result.status, ASTStatus.SUCCESS)
+        self.assertNotIn("Authentication Successful:screen", result.screenshots)
+
+        ast.capture_screenshots_parallel = True
+        result = ast.run(_FakeHost(), hosts=[_FakeHost(), _FakeHost()], **kwargs)
+        self.assertIn("Authentication Successful:screen", result.screenshots)
+
+    @patch("src.ast.base.get_dynamodb_client")
+    def test_item_timestamps_agree_with_duration(self, mock_db_factory: object) -> None:
+        mock_db_factory.return_value = _FakeDB()
+        ast = LoginAST()
+        ast.simulate_delay = 0.02
+
+        result = ast.run(
+            _FakeHost(), username="USER1", password="PASS1", policyNumbers=["ABC000001"]
+        )
+
+        item = result.item_results[0]
+        self.assertGreaterEqual(item.duration_ms, 20)
+        elapsed = item.completed_at - item.started_at
+        self.assertEqual(elapsed.microseconds // 1000 + elapsed.seconds * 1000, item.duration_ms)
+
+    @patch.dict("os.environ", {"AST_MAX_WORKERS": "1"})
+    @patch("src.ast.base.get_dynamodb_client")
+    @patch("src.ast.login.time.sleep", return_value=None)
+    def test_parallel_workers_are_capped_by_env(self, _sleep: object, mock_db_factory: object) -> None:
+        hosts = [_FakeHost(), _FakeHost()]
+        mock_db_factory.return_value = _FakeDB()
+
+        result = LoginAST().run(
+            hosts[0],
+            username="USER1",
+            password="PASS1",
+            policyNumbers=["ABC000001", "ABC000002", "ABC000003"],
+            hosts=hosts,
+        )
+
+        self.assertEqual(result.data["successCount"], 3)
+        self.assertEqual([host.filled.count(("Userid", "USER1")) for host in hosts], [1, 0])
+
+    @patch.dict("os.environ", {"AST_MAX_WORKERS": "auto"})
+    @patch("src.ast.base.get_dynamodb_client")
+    @patch("src.ast.login.time.sleep", return_value=None)
+    def test_invalid_worker_cap_falls_back_to_default(
+        self, _sleep: object, mock_db_factory: object
+    ) -> None:
+        hosts = [_FakeHost(), _FakeHost()]
+        mock_db_factory.return_value = _FakeDB()
+
+        result = LoginAST().run(
+            hosts[0],
+            username="USER1",
+            password="PASS1",
+            policyNumbers=["ABC000001", "ABC000002", "ABC000003"],
+            hosts=hosts,
+        )
+
+        self.assertEqual(result.status, ASTStatus.SUCCESS)
+        self.assertEqual(result.data["successCount"], 3)
+
+    @patch("src.ast.base.get_dynamodb_client")
+    @patch("src.ast.login.time.sleep", return_value=None)
+    def test_spare_hosts_are_left_idle(self, _sleep: object, mock_db_factory: object) -> None:
+        hosts = [_FakeHost(), _FakeHost(), _FakeHost()]
+        mock_db_factory.return_value = _FakeDB()
+
+        result = LoginAST().run(
+            hosts[0],
+            execution_id="exec-lifo",
+            username="USER1",
+            password="PASS1",
+            policyNumbers=["ABC000001"],
+            hosts=hosts,
+        )
+
+        self.assertEqual(result.status, ASTStatus.SUCCESS)
+        # Only the first host in the pool is signed in for a single item
+        self.assertEqual([host.filled.count(("Userid", "USER1")) for host in hosts], [1, 0, 0])
+
+    @patch("src.ast.base.get_dynamodb_client")
+    @patch("src.ast.login.time.sleep", return_value=None)
+    def test_item_results_are_written_in_batches(self, _sleep: object, mock_db_factory: object) -> None:
+        fake_db = _FakeDB()
+        mock_db_factory.return_value = fake_db
+
+        ast = LoginAST()
+        result = ast.run(
+            _FakeHost(),
+            execution_id="exec-batch",
+            username="USER1",
+            password="PASS1",
+            policyNumbers=[f"ABC{n:06d}" for n in range(30)],
+        )
+
+        self.assertEqual(result.status, ASTStatus.SUCCESS)
+        self.assertEqual(fake_db.batch_sizes, [25, 5])
+        self.assertTrue(fake_db.batch_threads[0].startswith("ast_sink"))
+        # The execution record is created on the sink too, ahead of results
+        self.assertEqual(len(fake_db.executions), 1)
+        self.assertTrue(fake_db.execution_threads[0].startswith("ast_sink"))
+        self.assertEqual(len(fake_db.policy_results), 30)
+        # Timestamps are serialized by the writer, not the recording thread
+        self.assertIsInstance(fake_db.policy_results[0][1]["started_at"], str)
+        # Counts advance with each written batch; the final update closes out
+        self.assertEqual(
+            [u["success_count"] for u in fake_db.updates], [25, 30]
+        )
+        self.assertNotIn("status", fake_db.updates[0])
+        self.assertEqual(fake_db.updates[-1]["status"], "success")
+
+    @patch("src.ast.base.get_dynamodb_client")
+    @patch("src.ast.login.time.sleep", return_value=None)
+    def test_final_counts_come_from_results_not_written_rows(
+        self, _sleep: object, mock_db_factory: object
+    ) -> None:
+        fake_db = _FakeDB()
+
+        def fail_batch(**_kwargs: object) -> None:
+            raise RuntimeError("throttled")
+
+        fake_db.batch_put_policy_results = fail_batch
+        mock_db_factory.return_value = fake_db
+
+        result = LoginAST().run(
+            _FakeHost(),
+            username="USER1",
+            password="PASS1",
+            policyNumbers=["ABC123456", "DEF123456", "GHI123456"],
+        )
+
+        self.assertEqual(result.data["successCount"], 3)
+        # No running-count update for the failed batch; the final one is whole
+        self.assertEqual(len(fake_db.updates), 1)
+        self.assertEqual(fake_db.updates[0]["success_count"], 3)
+
+    @patch("src.ast.base.get_dynamodb_client")
+    @patch("src.ast.login.time.sleep", return_value=None)
+    def test_session_is_reused_across_policies(self, _sleep: object, mock_db_factory: object) -> None:
+        host = _FakeHost()
+        mock_db_factory.return_value = _FakeDB()
+
+        ast = LoginAST()
+        result = ast.run(
+            host,
+            username="USER1",
+            password="PASS1",
+            policyNumbers=["ABC123456", "DEF123456", "GHI123456"],
+        )
+
+        self.assertEqual(result.data["successCount"], 3)
+        self.assertEqual(host.filled.count(("Userid", "USER1")), 1)
+        self.assertEqual(host.screens.count("Signed Off"), 1)
+
+    @patch("src.ast.base.get_dynamodb_client")
+    def test_full_cycle_per_item_logs_in_for_every_policy(self, mock_db_factory: object) -> None:
+        host = _FakeHost()
+        mock_db_factory.return_value = _FakeDB()
+
+        result = LoginAST().run(
+            host,
+            username="USER1",
+            password="PASS1",
+            policyNumbers=["ABC123456", "DEF123456"],
+            fullCyclePerItem=True,
+        )
+
+        self.assertEqual(result.data["successCount"], 2)
+        self.assertEqual(host.filled.count(("Userid", "USER1")), 2)
+        self.assertEqual(host.screens.count("Signed Off"), 2)
+
+    @patch("src.ast.base.get_dynamodb_client")
+    def test_lost_session_skips_recovery_logoff(self, mock_db_factory: object) -> None:
+        host = _FakeHost()
+        mock_db_factory.return_value = _FakeDB()
+        ast = LoginAST()
+
+        def drop_session(host, item, index, total):
+            host.is_connected = False
+            return False, "connection lost", {}
+
+        ast.process_single_item = drop_session
+        result = ast.run(host, username="USER1", password="PASS1", policyNumbers=["ABC123456"])
+
+        self.assertEqual(result.item_results[0].status, "failed")
+        self.assertNotIn("Exit Menu", host.screens)
+
+    @patch("src.ast.base.get_dynamodb_client")
+    def test_screenshots_are_capped_to_the_latest(self, mock_db_factory: object) -> None:
+        mock_db_factory.return_value = _FakeDB()
+        ast = LoginAST()
+        ast.max_screenshots = 2
+
+        result = ast.run(
+            _FakeHost(),
+            username="USER1",
+            password="PASS1",
+            policyNumbers=["ABC123456", "DEF123456", "GHI123456"],
+            fullCyclePerItem=True,
+        )
+
+        self.assertEqual(
+            result.screenshots,
+            ["Authentication Successful:screen", "Signed Off:screen"],
+        )
+
+    @patch("src.ast.base.get_dynamodb_client")
+    @patch("src.ast.login.time.sleep", return_value=None)
+    def test_failed_policy_forces_fresh_login(self, _sleep: object, mock_db_factory: object) -> None:
+        host = _FakeHost()
+        fake_db = _FakeDB()
+        mock_db_factory.return_value = fake_db
+
+        ast = LoginAST()
+        original = ast.process_single_item
+
+        def flaky(host, item, index, total):
+            if index == 1:
+                return False, "boom", {}
+            return original(host, item, index, total)
+
+        ast.process_single_item = flaky
+        result = ast.run(
+            host,
+            username="USER1",
+            password="PASS1",
+            policyNumbers=["ABC123456", "DEF123456"],
+        )
+
+        self.assertEqual([r.status for r in result.item_results], ["failed", "success"])
+        self.assertEqual(host.filled.count(("Userid", "USER1")), 2)
+        final = fake_db.updates[-1]
+        self.assertEqual(
+            (final["success_count"], final["failed_count"], final["skipped_count"]),
+            (1, 1, 0),
+        )
+
+    @patch("src.ast.base.get_dynamodb_client")
+    @patch("src.ast.login.time.sleep", return_value=None)
+    def test_cancel_stops_parallel_workers_between_items(self, _sleep: object, mock_db_factory: object) -> None:
+        mock_db_factory.return_value = _FakeDB()
+        ast = LoginAST()
+        original = ast.process_single_item
+
+        def process(host, item, index, total):
+            if index == 1:
+                ast.cancel()
+            return original(host, item, index, total)
+
+        ast.process_single_item = process
+        result = ast.run(
+            _FakeHost(),
+            username="USER1",
+            password="PASS1",
+            policyNumbers=[f"ABC{n:06d}" for n in range(20)],
+            hosts=[_FakeHost(), _FakeHost()],
+        )
+
+        self.assertEqual(result.status, ASTStatus.CANCELLED)
+        self.assertLess(len(result.item_results), 20)
+
+    @patch("src.ast.base.get_dynamodb_client")
+    @patch("src.ast.login.time.sleep", return_value=None)
+    def test_recording_error_does_not_strand_parallel_workers(
+        self, _sleep: object, mock_db_factory: object
+    ) -> None:
+        mock_db_factory.return_value = _FakeDB()
+        ast = LoginAST()
+
+        def on_item_result(*_args: object) -> None:
+            raise RuntimeError("callback broke")
+
+        ast.set_callbacks(on_item_result=on_item_result)
+        outcome: list = []
+        runner = threading.Thread(
+            target=lambda: outcome.append(
+                ast.run(
+                    _FakeHost(),
+                    username="USER1",
+                    password="PASS1",
+                    policyNumbers=[f"ABC{n:06d}" for n in range(40)],
+                    hosts=[_FakeHost(), _FakeHost()],
+                )
+            ),
+            daemon=True,
+        )
+        runner.start()
+        runner.join(timeout=5)
+
+        self.assertFalse(runner.is_alive())
+        self.assertEqual(outcome[0].status, ASTStatus.FAILED)
+        self.assertIn("callback broke", outcome[0].error)
+
+    @patch("src.ast.base.get_dynamodb_client")
+    @patch("src.ast.login.time.sleep", return_value=None)
+    def test_stale_buffer_is_flushed_before_a_full_batch(self, _sleep: object, mock_db_factory: object) -> None:
+        fake_db = _FakeDB()
+        mock_db_factory.return_value = fake_db
+
+        # Every result is already stale by the time the sink buffers it
+        with patch("src.ast.base._WRITE_FLUSH_INTERVAL", 0.0):
+            LoginAST().run(
+                _FakeHost(),
+                username="USER1",
+                password="PASS1",
+                policyNumbers=["ABC123456", "DEF123456", "GHI123456"],
+            )
+
+        self.assertEqual(fake_db.batch_sizes, [1, 1, 1])
+
+    @patch("src.ast.base._WRITE_FLUSH_INTERVAL", 0.05)
+    @patch("src.ast.base.get_dynamodb_client")
+    @patch("src.ast.login.time.sleep", return_value=None)
+    def test_stale_buffer_is_flushed_while_the_next_item_runs(
+        self, _sleep: object, mock_db_factory: object
+    ) -> None:
+        fake_db = _FakeDB()
+        mock_db_factory.return_value = fake_db
+        written = threading.Event()
+        batch_put = fake_db.batch_put_policy_results
+
+        def record_batch(execution_id: str, results: list[tuple[str, dict]]) -> None:
+            batch_put(execution_id, results)
+            written.set()
+
+        fake_db.batch_put_policy_results = record_batch
+        ast = LoginAST()
+        original = ast.process_single_item
+        flushed_during_item: list[bool] = []
+
+        def process(host, item, index, total):
+            if index == 2:
+                flushed_during_item.append(written.wait(timeout=5))
+            return original(host, item, index, total)
+
+        ast.process_single_item = process
+        ast.run(
+            _FakeHost(),
+            username="USER1",
+            password="PASS1",
+            policyNumbers=["ABC123456", "DEF123456"],
+        )
+
+        self.assertEqual(flushed_during_item, [True])
+        self.assertEqual(fake_db.batch_sizes, [1, 1])
+        # The age-based flush runs on the sink thread, not a timer of its own
+        self.assertEqual(set(fake_db.batch_threads), {"ast_sink"})
 
 
 if __name__ == "__main__":
@@ -26,13 +26,15 @@ class _fresh_module:
 
 
 class ModuleImportTests(unittest.TestCase):
-    def test_app_module_configures_structlog(self) -> None:
+    def test_app_module_defers_structlog_configuration(self) -> None:
         with patch("structlog.configure") as mock_config, patch(
             "structlog.get_logger", return_value=object()
         ):
             with _fresh_module("src.app") as app_module:
-                self.assertTrue(mock_config.called)
+                self.assertFalse(mock_config.called)
                 self.assertTrue(hasattr(app_module, "shutdown"))
+                app_module._configure_logging()
+                self.assertTrue(mock_config.called)
 
     def test_cli_module_sets_paths(self) -> None:
         with _fresh_module("src.cli") as cli_module:
@@ -57,6 +59,10 @@ class ModuleImportTests(unittest.TestCase):
             for name in ("LoginAST", "ASTStatus"):
                 self.assertTrue(hasattr(ast_module, name))
 
+            from src.ast import base, login
+
+            self.assertTrue(set(ast_module.__all__) <= set(base.__all__) | set(login.__all__))
+
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
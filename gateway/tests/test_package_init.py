@@ -5,6 +5,7 @@ from __future__ import annotations
 import importlib
 import sys
 import unittest
+from types import ModuleType, TracebackType
 
 
 class _fresh_module:
@@ -12,12 +13,17 @@ class _fresh_module:
         self.name = name
         self.original = sys.modules.get(name)
 
-    def __enter__(self):
+    def __enter__(self) -> ModuleType:
         if self.original is not None:
             sys.modules.pop(self.name, None)
         return importlib.import_module(self.name)
 
-    def __exit__(self, exc_type, exc, tb):
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> bool:
         sys.modules.pop(self.name, None)
         if self.original is not None:
             sys.modules[self.name] = self.original
@@ -28,7 +34,6 @@ class PackageInitTests(unittest.TestCase):
     def test_gateway_package_exports(self) -> None:
         with _fresh_module("src") as module:
             for name in [
-                "main",
                 "Config",
                 "TN3270Manager",
                 "ValkeyClient",
@@ -36,6 +41,29 @@ class PackageInitTests(unittest.TestCase):
             ]:
                 self.assertTrue(hasattr(module, name))
 
+    def test_gateway_package_exports_are_lazy(self) -> None:
+        from src.core import Config
+
+        with _fresh_module("src") as module:
+            self.assertNotIn("Config", vars(module))
+            config_cls = module.Config
+            self.assertIs(config_cls, Config)
+            self.assertIs(vars(module)["Config"], config_cls)
+            self.assertEqual(set(module.__all__), set(module._LAZY_EXPORTS))
+            self.assertFalse(hasattr(module, "does_not_exist"))
+            # The runtime entry point lives in src.app only
+            self.assertNotIn("main", module.__all__)
+
+    def test_ast_package_exports_are_lazy(self) -> None:
+        from src.ast.base import ASTStatus
+
+        with _fresh_module("src.ast") as module:
+            self.assertNotIn("ASTStatus", vars(module))
+            status_cls = module.ASTStatus
+            self.assertIs(status_cls, ASTStatus)
+            self.assertIn("ASTStatus", dir(module))
+            self.assertFalse(hasattr(module, "does_not_exist"))
+
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
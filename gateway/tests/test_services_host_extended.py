@@ -5,6 +5,7 @@ from __future__ import annotations
 import threading
 import time
 import unittest
+from unittest.mock import patch
 
 import src.services.tn3270.host as host_module
 from src.services.tn3270.host import (
@@ -320,6 +321,31 @@ class HostExtendedTests(unittest.TestCase):
         self.assertIn("keyboard_locked", snap)
         self.assertIn("Host", repr(self.host))
 
+    def test_wait_for_any_returns_first_target_on_screen(self) -> None:
+        self.tnz.scrstr = lambda *args, **kwargs: "READY  Logon ===>"  # type: ignore[assignment]
+        self.assertEqual(self.host.wait_for_any(["Welcome", "LOGON"], timeout=0.01), "LOGON")
+        self.assertIsNone(
+            self.host.wait_for_any(["LOGON"], timeout=0.01, case_sensitive=True)
+        )
+
+    def test_wait_for_any_backs_off_linearly_then_exponentially(self) -> None:
+        clock = [0.0]
+        delays: list[float] = []
+
+        def fake_sleep(seconds: float) -> None:
+            delays.append(seconds)
+            clock[0] += seconds
+
+        with patch.object(host_module.time, "monotonic", lambda: clock[0]), patch.object(
+            host_module.time, "sleep", fake_sleep
+        ):
+            self.assertIsNone(self.host.wait_for_any(["Never"], timeout=3))
+
+        self.assertAlmostEqual(delays[0], 0.001)
+        self.assertAlmostEqual(delays[1], 0.011)
+        self.assertIn(0.5, delays)
+        self.assertAlmostEqual(sum(delays), 3)
+
     def test_wait_for_text_timeout_and_keyboard_timeout(self) -> None:
         self.host.screen_contains = lambda *args, **kwargs: False  # type: ignore[assignment]
         self.assertFalse(self.host.wait_for_text("Never", timeout=0.01))
@@ -328,6 +354,12 @@ class HostExtendedTests(unittest.TestCase):
         self.host.wait = lambda timeout=0.1: False  # type: ignore[assignment]
         self.assertFalse(self.host.wait_for_keyboard(timeout=0.05))
 
+    def test_is_connected_tracks_session_loss(self) -> None:
+        self.tnz.seslost = False
+        self.assertTrue(self.host.is_connected)
+        self.tnz.seslost = True
+        self.assertFalse(self.host.is_connected)
+
     def test_basic_properties(self) -> None:
         self.assertEqual(self.host.rows, self.tnz.maxrow)
         self.assertEqual(self.host.cols, self.tnz.maxcol)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import unittest
 from unittest import IsolatedAsyncioTestCase
 from unittest.mock import AsyncMock, patch
@@ -92,6 +93,39 @@ class TN3270ManagerTests(IsolatedAsyncioTestCase):
         self.valkey.unsubscribe_tn3270_session.assert_awaited_once_with("session-2")
         self.assertEqual(self.manager.session_count, 0)
 
+    async def test_destroy_all_sessions_runs_concurrently(self) -> None:
+        self.manager._sessions = {"a": object(), "b": object()}  # type: ignore[dict-item]
+        started: list[str] = []
+        release = asyncio.Event()
+
+        async def fake_destroy(session_id: str, reason: str = "closed") -> None:
+            started.append(session_id)
+            self.manager._sessions.pop(session_id, None)
+            await release.wait()
+            if session_id == "a":
+                raise RuntimeError("boom")
+
+        with patch.object(self.manager, "destroy_session", new=fake_destroy):
+            task = asyncio.create_task(self.manager.destroy_all_sessions())
+            for _ in range(3):
+                await asyncio.sleep(0)
+            self.assertEqual(sorted(started), ["a", "b"])
+            release.set()
+            await task
+
+        self.assertEqual(self.manager.session_count, 0)
+
+    async def test_executor_is_sized_from_max_sessions(self) -> None:
+        small = TN3270Manager(TN3270Config(max_sessions=2), self.valkey)  # type: ignore[arg-type]
+        large = TN3270Manager(TN3270Config(max_sessions=16), self.valkey)  # type: ignore[arg-type]
+        for manager in (small, large):
+            self.addCleanup(manager._executor.shutdown, wait=False)
+
+        self.assertEqual(small._executor._max_workers, 10)
+        self.assertEqual(large._executor._max_workers, 32)
+        # A second manager leaves the first one's pool running
+        self.assertEqual(small._executor.submit(lambda: "ok").result(timeout=1), "ok")
+
     async def test_create_session_enforces_maximum_limit(self) -> None:
         self.manager._sessions["existing"] = object()  # Simulate max_sessions == 2 with one entry
         self.manager._sessions["existing-2"] = object()
@@ -18,7 +18,12 @@ from src.models import (
     SessionDestroyMessage,
     serialize_message,
 )
-from src.services.tn3270.manager import KEY_MAPPINGS, TN3270Manager, TN3270Session
+from src.services.tn3270.manager import (
+    KEY_MAPPINGS,
+    TN3270Manager,
+    TN3270Session,
+    _parse_concurrency,
+)
 
 
 class _StubValkey:
@@ -281,6 +286,9 @@ class ManagerExtendedTests(unittest.IsolatedAsyncioTestCase):
                     self.callbacks["on_item_result"]("item", "success", 10, None, {})
                 return ASTResult(status=ASTStatus.SUCCESS, message="ok")
 
+            async def run_async(self, host, execution_id: str, executor=None, **kwargs):
+                return self.run(host, execution_id, **kwargs)
+
         class FakeLoop:
             async def run_in_executor(self, executor, func, *args, **kwargs):
                 return func(*args, **kwargs)
@@ -311,6 +319,121 @@ class ManagerExtendedTests(unittest.IsolatedAsyncioTestCase):
         self.assertGreaterEqual(self.valkey.publish_tn3270_output.await_count, 2)
         self.assertIsNone(session.running_ast)
 
+    async def test_open_extra_tnz_uses_headroom_and_skips_failures(self) -> None:
+        session = TN3270Session(
+            session_id="sess",
+            host="h",
+            port=23,
+            tnz=_StubTnz(),
+            renderer=self.manager._renderer,
+            connected=True,
+        )
+        self.manager._sessions["sess"] = session
+        opened = MagicMock()
+
+        def create(name: str, host: str, port: int):
+            if name == "sess-ast1":
+                return opened
+            raise OSError("refused")
+
+        with patch.object(self.manager, "_create_tnz_connection", side_effect=create) as create_mock:
+            extra = await self.manager._open_extra_tnz(session, 3)
+
+        # max_sessions=2 with one live session leaves room for one more
+        self.assertEqual(create_mock.call_count, 1)
+        self.assertEqual(extra, [opened])
+        opened.wait.assert_called_once_with(timeout=2)
+
+        # The extra holds the last slot against other runs and new sessions
+        self.assertEqual(await self.manager._open_extra_tnz(session, 1), [])
+        with self.assertRaises(TerminalError):
+            await self.manager.create_session("other")
+
+        await self.manager._close_extra_tnz(extra)
+        opened.close.assert_called_once()
+        self.assertEqual(self.manager._reserved_extras, 0)
+
+    async def test_open_extra_tnz_closes_connection_when_wait_fails(self) -> None:
+        session = TN3270Session(
+            session_id="sess",
+            host="h",
+            port=23,
+            tnz=_StubTnz(),
+            renderer=self.manager._renderer,
+            connected=True,
+        )
+        self.manager._sessions["sess"] = session
+        stalled = MagicMock()
+        stalled.wait.side_effect = OSError("no screen")
+
+        with patch.object(self.manager, "_create_tnz_connection", return_value=stalled):
+            extra = await self.manager._open_extra_tnz(session, 1)
+
+        self.assertEqual(extra, [])
+        stalled.close.assert_called_once()
+        self.assertEqual(self.manager._reserved_extras, 0)
+
+    async def test_run_ast_spreads_over_extra_connections(self) -> None:
+        captured: dict = {}
+
+        class StubAST:
+            def set_callbacks(self, **kwargs):
+                pass
+
+            async def run_async(self, host, execution_id: str, executor=None, **kwargs):
+                captured.update(kwargs, host=host)
+                return ASTResult(status=ASTStatus.SUCCESS, message="ok")
+
+        session = TN3270Session(
+            session_id="sess",
+            host="h",
+            port=23,
+            tnz=_StubTnz(),
+            renderer=self.manager._renderer,
+            connected=True,
+        )
+        extra_tnz = [MagicMock()]
+        close_extra = AsyncMock()
+        with patch("src.services.tn3270.manager.LoginAST", return_value=StubAST()), patch.object(
+            self.manager, "_open_extra_tnz", new=AsyncMock(return_value=extra_tnz)
+        ) as open_extra, patch.object(
+            self.manager, "_close_extra_tnz", new=close_extra
+        ), patch.object(self.manager, "_send_screen_update", new=AsyncMock()):
+            await self.manager._run_ast(session, "login", {"concurrency": 2, "foo": "bar"})
+
+        open_extra.assert_awaited_once_with(session, 1)
+        close_extra.assert_awaited_once_with(extra_tnz)
+        self.assertNotIn("concurrency", captured)
+        self.assertEqual(captured["foo"], "bar")
+        self.assertIs(captured["hosts"][0], captured["host"])
+        self.assertIs(captured["hosts"][1]._tnz, extra_tnz[0])
+
+    async def test_run_ast_rejects_invalid_concurrency(self) -> None:
+        session = TN3270Session(
+            session_id="sess",
+            host="h",
+            port=23,
+            tnz=_StubTnz(),
+            renderer=self.manager._renderer,
+            connected=True,
+        )
+        for value in ("abc", "1.5", 1.5, -2, 0, True):
+            self.valkey.publish_tn3270_output.reset_mock()
+            with patch.object(
+                self.manager, "_open_extra_tnz", new=AsyncMock(return_value=[])
+            ) as open_extra:
+                await self.manager._run_ast(session, "login", {"concurrency": value})
+
+            open_extra.assert_not_awaited()
+            sent = self.valkey.publish_tn3270_output.await_args.args[1]
+            self.assertIn("Invalid concurrency", sent)
+            self.assertIsNone(session.running_ast)
+
+    def test_parse_concurrency_accepts_integer_strings(self) -> None:
+        self.assertEqual(_parse_concurrency("3"), 3)
+        self.assertEqual(_parse_concurrency(2), 2)
+        self.assertEqual(_parse_concurrency(None), 1)
+
     async def test_run_ast_unknown_name_raises(self) -> None:
         session = TN3270Session(
             session_id="sess",
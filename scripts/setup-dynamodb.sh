@@ -18,6 +18,7 @@
 #
 # GSI1 (GSI1): GSI1PK=email for user lookup by email
 # GSI2 (GSI2): GSI2PK=USER#<userId>#DATE#<date>, GSI2SK=started_at for user's executions by date
+# GSI3 (GSI3): execution_id for execution (and policy) lookup by execution id
 # ============================================================================
 
 set -e